@@ -6,11 +6,13 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
+from clocky.cache import read_cached, read_stale, touch_cached, write_cached
 from clocky.models import (
     Client,
     Project,
@@ -24,6 +26,15 @@ from clocky.models import (
 
 BASE_URL = "https://api.clockify.me/api/v1"
 
+# Fixed query strings, shared by every call (httpx copies params, never mutates).
+_PAGE_500: dict[str, str | int] = {"page-size": 500}
+_RUNNING_PARAMS: dict[str, str | int] = {"in-progress": "true", "page-size": 1}
+
+# Built once at import time and reused by every list endpoint.
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {
+    model: TypeAdapter(list[model]) for model in (Client, Project, Tag, TimeEntry, Workspace)
+}
+
 
 class ClockifyAPI:
     """HTTP client for the Clockify REST API.
@@ -31,29 +42,35 @@ class ClockifyAPI:
     Authenticates via X-Api-Key header. Methods raise httpx.HTTPStatusError on failure.
     """
 
-    def __init__(self, api_key: str, base_url: str = BASE_URL) -> None:
+    def __init__(self, api_key: str, base_url: str = BASE_URL, *, cache_ttl: float = 0.0) -> None:
         """Create a new API client.
 
         Args:
             api_key: Your Clockify API key.
             base_url: API base URL (override for testing).
+            cache_ttl: Seconds to reuse on-disk copies of the project, client
+                and tag lists. ``0`` disables the cache.
 
         """
+        self._cache_ttl = cache_ttl
+        # Cache files are per API key, so switching accounts never reuses lists.
+        self._cache_scope = hashlib.sha256(api_key.encode()).hexdigest()[:12]
         self._client = httpx.Client(
             base_url=base_url,
             headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
             timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0),
         )
 
     # -------------------------------------------------------------------------
     # Private helpers
     # -------------------------------------------------------------------------
 
-    def _get(self, url: str, *, params: dict[str, str | int] | None = None) -> Any:
-        """Execute a GET request and return the parsed JSON body."""
+    def _get_raw(self, url: str, *, params: dict[str, str | int] | None = None) -> bytes:
+        """Execute a GET request and return the raw JSON body."""
         r = self._client.get(url, params=params)
         r.raise_for_status()
-        return r.json()
+        return r.content
 
     def _get_list[T: BaseModel](
         self,
@@ -61,9 +78,47 @@ class ClockifyAPI:
         model: type[T],
         *,
         params: dict[str, str | int] | None = None,
+        cache_key: str | None = None,
+        fresh: bool = False,
     ) -> list[T]:
-        """Execute a GET request and validate the JSON array as a list of models."""
-        return [model.model_validate(item) for item in self._get(url, params=params)]
+        """Execute a GET request and validate the JSON array as a list of models.
+
+        The raw body is handed straight to pydantic-core, which parses and
+        validates in a single pass without building intermediate dicts. When
+        ``cache_key`` is given and caching is enabled, a fresh on-disk copy of
+        the body is used instead of hitting the network; ``fresh=True`` skips
+        that copy and revalidates with the server.
+        """
+        if cache_key is None or self._cache_ttl <= 0:
+            body = self._get_raw(url, params=params)
+        else:
+            cache_key = f"{self._cache_scope}-{cache_key}"
+            body = None if fresh else read_cached(cache_key, self._cache_ttl)
+            if body is None:
+                body = self._get_revalidated(url, cache_key, params=params)
+        return _LIST_ADAPTERS[model].validate_json(body)
+
+    def _get_revalidated(
+        self,
+        url: str,
+        cache_key: str,
+        *,
+        params: dict[str, str | int] | None = None,
+    ) -> bytes:
+        """Fetch a body, sending ``If-None-Match`` when a stale cached copy exists.
+
+        On ``304 Not Modified`` the cached body is reused and marked fresh;
+        otherwise the new body (and its ``ETag``) replaces the cache entry.
+        """
+        stale = read_stale(cache_key)
+        headers = {"If-None-Match": stale[0]} if stale else None
+        r = self._client.get(url, params=params, headers=headers)
+        if stale and r.status_code == httpx.codes.NOT_MODIFIED:
+            touch_cached(cache_key)
+            return stale[1]
+        r.raise_for_status()
+        write_cached(cache_key, r.content, etag=r.headers.get("ETag"))
+        return r.content
 
     # -------------------------------------------------------------------------
     # User & Workspace
@@ -71,7 +126,7 @@ class ClockifyAPI:
 
     def get_user(self) -> User:
         """Fetch the authenticated user."""
-        return User.model_validate(self._get("/user"))
+        return User.model_validate_json(self._get_raw("/user"))
 
     def get_workspaces(self) -> list[Workspace]:
         """Fetch all workspaces the user belongs to."""
@@ -81,21 +136,59 @@ class ClockifyAPI:
     # Projects, Clients, Tags
     # -------------------------------------------------------------------------
 
-    def get_projects(self, workspace_id: str) -> list[Project]:
-        """Fetch all projects in a workspace."""
+    def get_projects(
+        self,
+        workspace_id: str,
+        *,
+        fresh: bool = False,
+        client_ids: list[str] | None = None,
+    ) -> list[Project]:
+        """Fetch projects in a workspace, optionally only those of some clients.
+
+        Args:
+            workspace_id: Workspace to list.
+            fresh: Bypass the TTL cache and revalidate with the server.
+            client_ids: Filter server-side to these clients (cached separately).
+
+        """
+        params, cache_key = _PAGE_500, f"projects-{workspace_id}.json"
+        if client_ids:
+            joined = ",".join(sorted(client_ids))
+            params = {**_PAGE_500, "clients": joined}
+            cache_key = f"projects-{workspace_id}-clients-{joined}.json"
         return self._get_list(
-            f"/workspaces/{workspace_id}/projects", Project, params={"page-size": 500}
+            f"/workspaces/{workspace_id}/projects",
+            Project,
+            params=params,
+            cache_key=cache_key,
+            fresh=fresh,
         )
 
+    def get_project(self, workspace_id: str, project_id: str) -> Project | None:
+        """Fetch a single project by ID, or None if it does not exist."""
+        r = self._client.get(f"/workspaces/{workspace_id}/projects/{project_id}")
+        if r.status_code == httpx.codes.NOT_FOUND:
+            return None
+        r.raise_for_status()
+        return Project.model_validate_json(r.content)
+
     def get_clients(self, workspace_id: str) -> list[Client]:
         """Fetch all clients in a workspace."""
         return self._get_list(
-            f"/workspaces/{workspace_id}/clients", Client, params={"page-size": 500}
+            f"/workspaces/{workspace_id}/clients",
+            Client,
+            params=_PAGE_500,
+            cache_key=f"clients-{workspace_id}.json",
         )
 
-    def get_tags(self, workspace_id: str) -> list[Tag]:
-        """Fetch all tags in a workspace."""
-        return self._get_list(f"/workspaces/{workspace_id}/tags", Tag)
+    def get_tags(self, workspace_id: str, *, fresh: bool = False) -> list[Tag]:
+        """Fetch all tags in a workspace (``fresh`` bypasses the TTL cache)."""
+        return self._get_list(
+            f"/workspaces/{workspace_id}/tags",
+            Tag,
+            cache_key=f"tags-{workspace_id}.json",
+            fresh=fresh,
+        )
 
     # -------------------------------------------------------------------------
     # Time Entries
@@ -106,21 +199,26 @@ class ClockifyAPI:
         workspace_id: str,
         user_id: str,
         limit: int = 10,
+        project_id: str | None = None,
     ) -> list[TimeEntry]:
-        """Fetch recent time entries for a user."""
+        """Fetch recent time entries for a user, optionally for one project only."""
+        params: dict[str, str | int] = {"page-size": limit}
+        if project_id is not None:
+            params["project"] = project_id
         return self._get_list(
             f"/workspaces/{workspace_id}/user/{user_id}/time-entries",
             TimeEntry,
-            params={"page-size": limit},
+            params=params,
         )
 
     def get_running_timer(self, workspace_id: str, user_id: str) -> TimeEntry | None:
         """Fetch the currently running time entry, or None if no timer is active."""
-        entries = self._get(
+        entries = self._get_list(
             f"/workspaces/{workspace_id}/user/{user_id}/time-entries",
-            params={"in-progress": "true", "page-size": 1},
+            TimeEntry,
+            params=_RUNNING_PARAMS,
         )
-        return TimeEntry.model_validate(entries[0]) if entries else None
+        return entries[0] if entries else None
 
     def start_timer(self, workspace_id: str, request: StartTimerRequest) -> TimeEntry:
         """Start a new time entry."""
@@ -129,7 +227,7 @@ class ClockifyAPI:
             json=request.to_api_dict(),
         )
         r.raise_for_status()
-        return TimeEntry.model_validate(r.json())
+        return TimeEntry.model_validate_json(r.content)
 
     def stop_timer(
         self,
@@ -143,7 +241,7 @@ class ClockifyAPI:
             json={"end": request.end},
         )
         r.raise_for_status()
-        return TimeEntry.model_validate(r.json())
+        return TimeEntry.model_validate_json(r.content)
 
     def delete_time_entry(self, workspace_id: str, entry_id: str) -> None:
         """Delete a time entry."""
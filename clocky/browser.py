@@ -6,23 +6,43 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import subprocess
-import webbrowser
+import shutil
+from functools import cache
 
 CLOCKIFY_API_KEY_URL = "https://app.clockify.me/user/settings#apiKey"
 
 
+@cache
+def _xdg_open() -> str | None:
+    """Return the path to ``xdg-open``, looked up once per process."""
+    return shutil.which("xdg-open")
+
+
 def open_browser(url: str) -> None:
-    """Open a URL in the default browser.
+    """Open a URL in the default browser without blocking.
 
-    Tries ``xdg-open`` first (Linux/desktop), then falls back to the
-    stdlib ``webbrowser`` module.
+    Launches ``xdg-open`` (Linux/desktop) detached in its own session, so the
+    terminal returns immediately; falls back to the stdlib ``webbrowser``
+    module when it is unavailable.
 
     Args:
         url: URL to open.
 
     """
-    try:
-        subprocess.run(["xdg-open", url], check=True, capture_output=True)  # noqa: S603, S607
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        webbrowser.open(url)
+    xdg_open = _xdg_open()
+    if xdg_open is not None:
+        import subprocess
+
+        try:
+            subprocess.Popen(  # noqa: S603
+                [xdg_open, url],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return
+        except OSError:
+            pass
+    import webbrowser
+
+    webbrowser.open(url)
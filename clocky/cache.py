@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: MIT
+"""On-disk cache for slow-changing workspace data (projects, tags).
+
+SPDX-License-Identifier: MIT
+
+Entries are raw API response bodies stored under ``~/.cache/clocky``. Freshness
+is decided by file mtime, so a cache hit costs one ``stat`` and one read. When
+the server sent an ``ETag``, it is kept in a ``.etag`` sidecar so stale entries
+can be revalidated with a conditional request instead of re-downloaded.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from clocky.paths import cache_dir
+
+
+def read_cached(name: str, ttl: float) -> bytes | None:
+    """Return the cached body for *name* if it is younger than *ttl* seconds.
+
+    Args:
+        name: Cache entry file name.
+        ttl: Maximum age in seconds.
+
+    Returns:
+        The cached bytes, or ``None`` when missing or stale.
+
+    """
+    path = cache_dir() / name
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def read_stale(name: str) -> tuple[str, bytes] | None:
+    """Return ``(etag, body)`` for an entry that can be revalidated, if any.
+
+    Args:
+        name: Cache entry file name.
+
+    Returns:
+        The stored ETag and body, or ``None`` when either is missing.
+
+    """
+    path = cache_dir() / name
+    try:
+        etag = path.with_name(f"{name}.etag").read_text(encoding="utf-8")
+        return etag, path.read_bytes()
+    except OSError:
+        return None
+
+
+def touch_cached(name: str) -> None:
+    """Mark an entry as fresh again (after a ``304 Not Modified``)."""
+    try:
+        (cache_dir() / name).touch()
+    except OSError:
+        pass
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a torn file."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    tmp.chmod(0o600)
+    os.replace(tmp, path)
+
+
+def write_cached(name: str, data: bytes, *, etag: str | None = None) -> None:
+    """Store *data* under *name*, replacing any previous entry atomically.
+
+    Failures are ignored: the cache is an optimisation, never a requirement.
+
+    Args:
+        name: Cache entry file name.
+        data: Raw response body.
+        etag: ``ETag`` response header, kept for conditional revalidation.
+
+    """
+    path = cache_dir() / name
+    etag_path = path.with_name(f"{name}.etag")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, data)
+        if etag:
+            _write_atomic(etag_path, etag.encode())
+        else:
+            etag_path.unlink(missing_ok=True)
+    except OSError:
+        pass
@@ -6,19 +6,18 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import os
 import sys
 from collections import Counter
 from datetime import UTC, datetime
-from importlib.metadata import version as _pkg_version
-from typing import Annotated
+from itertools import chain
+from typing import Annotated, Any
 
-import questionary
 import typer
-from rich.console import Console
 
 from clocky.api import ClockifyAPI
-from clocky.context import build_context
+from clocky.console import console as _console
+from clocky.context import AppContext, build_context
+from clocky.daemon import request as daemon_request
 from clocky.display import (
     print_error,
     print_no_timer,
@@ -29,10 +28,13 @@ from clocky.display import (
     print_timer_stopped,
 )
 from clocky.fuzzy import fuzzy_choices, fuzzy_search
-from clocky.models import StartTimerRequest, StopTimerRequest, Tag
+from clocky.models import StartTimerRequest, StopTimerRequest, Tag, TimeEntry
 from clocky.output import emit_json, get_mode, set_mode, time_entry_to_dict
 from clocky.tag_map import TagMap
 
+# One CLI invocation never changes its stdin, so probe the terminal once.
+_STDIN_IS_TTY = sys.stdin is not None and sys.stdin.isatty()
+
 app = typer.Typer(
     name="clocky",
     help="A CLI to interact with your Clockify account.",
@@ -43,7 +45,9 @@ app = typer.Typer(
 def _version_callback(value: bool) -> None:
     """Print the package version and exit when ``--version`` is passed."""
     if value:
-        typer.echo(f"clocky {_pkg_version('clocky-cli')}")
+        from importlib.metadata import version
+
+        typer.echo(f"clocky {version('clocky-cli')}")
         raise typer.Exit()
 
 
@@ -77,8 +81,12 @@ def _main_options(
 
 # Subcommands are registered below (see clocky.cli_tag_map).
 
-_no_color = bool(os.environ.get("NO_COLOR"))
-console = Console(no_color=_no_color)
+
+def _log(msg: str) -> None:
+    """Print an informational Rich-markup line unless ``--quiet``/``--json`` is active."""
+    if get_mode().quiet:
+        return
+    _console().print(msg)
 
 
 # -----------------------------------------------------------------------------
@@ -87,8 +95,9 @@ console = Console(no_color=_no_color)
 
 
 def _now_utc() -> str:
-    """Return current UTC time as ISO string."""
-    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    """Return current UTC time as ISO string (``YYYY-MM-DDTHH:MM:SSZ``)."""
+    n = datetime.now(UTC)
+    return f"{n.year:04d}-{n.month:02d}-{n.day:02d}T{n.hour:02d}:{n.minute:02d}:{n.second:02d}Z"
 
 
 def _pick_one[T](
@@ -108,9 +117,11 @@ def _pick_one[T](
     if len(matches) == 1:
         return matches[0][0]
 
-    if non_interactive or not sys.stdin.isatty():
+    if non_interactive or not _STDIN_IS_TTY:
         return matches[0][0]
 
+    import questionary  # deferred: prompt_toolkit dominates CLI startup time
+
     choices = fuzzy_choices(matches, attr)
     choices.append(questionary.Choice("[Cancel]", value=None))
     return questionary.select("Pick one:", choices=choices).ask()
@@ -124,8 +135,8 @@ def _infer_tag_for_project(
 ) -> str | None:
     """Infer the most likely tag for a project based on recent entries.
 
-    Looks at the last 50 entries for this project and returns the most
-    commonly used tag ID, if any.
+    Looks at the last 50 entries for this project (filtered server-side) and
+    returns the most commonly used tag ID, if any.
 
     Args:
         api: Clockify API client.
@@ -137,19 +148,20 @@ def _infer_tag_for_project(
         The most commonly used tag ID, or None if no data exists.
 
     """
-    entries = api.get_time_entries(workspace_id, user_id, limit=50)
+    entries = api.get_time_entries(workspace_id, user_id, limit=50, project_id=project_id)
 
-    tag_counts: Counter[str] = Counter()
-    for entry in entries:
-        if entry.project_id == project_id and entry.tag_ids:
-            for tag_id in entry.tag_ids:
-                tag_counts[tag_id] += 1
+    tag_counts = Counter(chain.from_iterable(e.tag_ids for e in entries))
+    # max() keeps the first-seen tag on ties, like most_common(1), without sorting.
+    return max(tag_counts, key=tag_counts.__getitem__, default=None)
 
-    if not tag_counts:
-        return None
 
-    most_common_tag_id, _count = tag_counts.most_common(1)[0]
-    return most_common_tag_id
+def _is_exact(matches: list[tuple[Any, float]], query: str) -> bool:
+    """Return True if the best fuzzy match is *query* itself, ignoring case.
+
+    Only such a match is safe to take from a cached list: anything else may
+    be beaten by a project or tag created since the list was cached.
+    """
+    return bool(matches) and matches[0][0].name.casefold() == query.casefold()
 
 
 def _resolve_tag_ids(
@@ -160,6 +172,7 @@ def _resolve_tag_ids(
     project_name: str,
     tags: list[str] | None,
     all_tags: list[Tag],
+    tag_name_by_id: dict[str, str],
     *,
     auto_tag: bool,
     non_interactive: bool,
@@ -176,7 +189,10 @@ def _resolve_tag_ids(
         project_id: ID of the chosen project.
         project_name: Display name of the chosen project.
         tags: Explicit tag name(s) from ``--tag`` option, or ``None``.
-        all_tags: All available tags in the workspace.
+        all_tags: All available tags in the workspace, possibly from the cache.
+            An explicit tag without an exact match triggers one fresh fetch.
+        tag_name_by_id: Tag ID → name for ``all_tags`` (shared with the caller,
+            updated in place after a fresh fetch).
         auto_tag: Whether to infer a tag from recent history.
         non_interactive: Whether to suppress interactive prompts.
 
@@ -189,75 +205,72 @@ def _resolve_tag_ids(
             stderr as a launcher-readable sentinel before exiting.
 
     """
-    mode = get_mode()
-    tags_by_id = {t.id: t for t in all_tags}
+    tag_names = [t.name for t in all_tags]
     tag_ids: list[str] = []
+    tag_map = TagMap.load()
 
     if tags is not None:
         # Explicit tags: fuzzy-resolve each one and persist a 1:1 mapping when
         # exactly one tag is provided.
+        refreshed = False
         for t in tags:
-            tag_matches = fuzzy_search(t, all_tags, key=lambda tag: tag.name)
+            tag_matches = fuzzy_search(t, all_tags, key=lambda tag: tag.name, names=tag_names)
+            if not refreshed and not _is_exact(tag_matches, t):
+                all_tags = api.get_tags(workspace_id, fresh=True)
+                tag_names = [tag.name for tag in all_tags]
+                tag_name_by_id.update(zip((tag.id for tag in all_tags), tag_names, strict=True))
+                refreshed = True
+                tag_matches = fuzzy_search(t, all_tags, key=lambda tag: tag.name, names=tag_names)
             if not tag_matches:
                 print_error(f"Tag '{t}' not found, skipping")
                 continue
             chosen_tag = _pick_one(tag_matches, "name", non_interactive=non_interactive)
             if chosen_tag:
                 tag_ids.append(chosen_tag.id)
-                if not mode.quiet:
-                    console.print(
-                        f"[dim]Tag (explicit):[/dim] [magenta]{chosen_tag.name}[/magenta]"
-                    )
+                _log(f"[dim]Tag (explicit):[/dim] [magenta]{chosen_tag.name}[/magenta]")
 
         if len(tag_ids) == 1:
-            TagMap.load().set(project_id, tag_ids[0]).save()
+            tag_map = tag_map.set(project_id, tag_ids[0])
 
     else:
         # No tags provided: stored mapping → history inference → interactive prompt
-        tag_map = TagMap.load()
-        mapped = tag_map.get(project_id)
+        mapped = tag_map.project_to_tag.get(project_id)
 
-        if mapped and mapped in tags_by_id:
+        if mapped and mapped in tag_name_by_id:
             tag_ids.append(mapped)
-            if not mode.quiet:
-                console.print(
-                    f"[dim]Tag (mapped):[/dim] [magenta]{tags_by_id[mapped].name}[/magenta]"
-                )
+            _log(f"[dim]Tag (mapped):[/dim] [magenta]{tag_name_by_id[mapped]}[/magenta]")
 
         elif auto_tag:
             inferred = _infer_tag_for_project(api, workspace_id, user_id, project_id)
-            if inferred and inferred in tags_by_id:
+            if inferred and inferred in tag_name_by_id:
                 tag_ids.append(inferred)
-                if not mode.quiet:
-                    console.print(
-                        f"[dim]Tag (auto):[/dim] [magenta]{tags_by_id[inferred].name}[/magenta]"
-                    )
-                tag_map.set(project_id, inferred).save()
-
-        if not tag_ids and sys.stdin.isatty():
-            console.print(f"\nNo tag found for project [cyan]{project_name}[/cyan].")
+                _log(f"[dim]Tag (auto):[/dim] [magenta]{tag_name_by_id[inferred]}[/magenta]")
+                tag_map = tag_map.set(project_id, inferred)
+
+        if not tag_ids and _STDIN_IS_TTY:
+            _console().print(f"\nNo tag found for project [cyan]{project_name}[/cyan].")
             tag_query = typer.prompt("Tag (fuzzy)").strip()
             if tag_query:
-                tag_matches = fuzzy_search(tag_query, all_tags, key=lambda tag: tag.name)
+                tag_matches = fuzzy_search(
+                    tag_query, all_tags, key=lambda tag: tag.name, names=tag_names
+                )
                 if tag_matches:
                     chosen_tag = _pick_one(tag_matches, "name", non_interactive=non_interactive)
                     if chosen_tag:
                         tag_ids.append(chosen_tag.id)
-                        tag_map.set(project_id, chosen_tag.id).save()
-                        if not mode.quiet:
-                            console.print(
-                                f"[dim]Tag (chosen):[/dim] [magenta]{chosen_tag.name}[/magenta]"
-                            )
+                        tag_map = tag_map.set(project_id, chosen_tag.id)
+                        _log(f"[dim]Tag (chosen):[/dim] [magenta]{chosen_tag.name}[/magenta]")
 
         if not tag_ids and non_interactive:
             # Launcher-friendly sentinel for GUI scripts.
-            Console(stderr=True).print("CLOCKY_ERROR_MISSING_TAG_MAP")
+            typer.echo("CLOCKY_ERROR_MISSING_TAG_MAP", err=True)
             print_error(
                 f"No tag mapping found for '{project_name}'. Provide --tag once to set it, "
                 "or let the launcher prompt you."
             )
             raise typer.Exit(1)
 
+    tag_map.save_if_dirty()
     return tag_ids
 
 
@@ -274,12 +287,38 @@ def setup() -> None:
     run_setup()
 
 
+def _resolve_status(
+    ctx: AppContext, *, with_tags: bool
+) -> tuple[TimeEntry | None, str | None, list[str]]:
+    """Fetch the running timer plus its project name (and tag names if asked)."""
+    entry = ctx.api.get_running_timer(ctx.workspace_id, ctx.user.id)
+    if not entry:
+        return None, None, []
+
+    project_name = None
+    if entry.project_id:
+        project_name = ctx.project_name_by_id.get(entry.project_id)
+        if project_name is None:
+            # Archived or created after the project list was cached.
+            project = ctx.api.get_project(ctx.workspace_id, entry.project_id)
+            project_name = project.name if project else None
+
+    tag_names: list[str] = []
+    if with_tags:
+        tag_names = [ctx.tag_name_by_id.get(tid, tid) for tid in entry.tag_ids]
+    return entry, project_name, tag_names
+
+
 @app.command()
 def status() -> None:
     """Show the currently running timer."""
     mode = get_mode()
-    ctx = build_context()
-    entry = ctx.api.get_running_timer(ctx.workspace_id, ctx.user.id)
+    reply = daemon_request("status", tags=mode.json)
+    if reply is not None:
+        entry = TimeEntry.model_validate(reply["entry"]) if reply["entry"] else None
+        project_name, tag_names = reply["project_name"], reply["tag_names"]
+    else:
+        entry, project_name, tag_names = _resolve_status(build_context(), with_tags=mode.json)
 
     if not entry:
         if mode.json:
@@ -288,20 +327,40 @@ def status() -> None:
         print_no_timer()
         return
 
-    project_name = None
-    if entry.project_id:
-        projects = {p.id: p.name for p in ctx.api.get_projects(ctx.workspace_id)}
-        project_name = projects.get(entry.project_id)
-
     if mode.json:
-        tag_map = {t.id: t.name for t in ctx.api.get_tags(ctx.workspace_id)}
-        tag_names = [tag_map.get(tid, tid) for tid in entry.tag_ids]
         emit_json(time_entry_to_dict(entry, project_name=project_name, tag_names=tag_names))
         return
 
     print_status(entry, project_name)
 
 
+@app.command("daemon")
+def daemon_cmd() -> None:
+    """Keep a warm API client running so `status` answers without reconnecting."""
+    from clocky.daemon import serve, socket_path
+
+    warm = build_context()
+
+    def _status(req: dict[str, Any]) -> dict[str, Any]:
+        # Fresh context per request: reuse the client, never serve stale tag names.
+        ctx = AppContext(api=warm.api, user=warm.user, workspace_id=warm.workspace_id)
+        entry, project_name, tag_names = _resolve_status(ctx, with_tags=bool(req.get("tags")))
+        return {
+            "entry": entry.model_dump(mode="json", by_alias=True) if entry else None,
+            "project_name": project_name,
+            "tag_names": tag_names,
+        }
+
+    _console().print(f"[dim]Serving on {socket_path()} — Ctrl+C to stop.[/dim]")
+    try:
+        serve({"status": _status})
+    except RuntimeError as e:
+        print_error(str(e))
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        pass
+
+
 @app.command()
 def start(
     project: Annotated[str, typer.Argument(..., help="Project name to fuzzy-search")],
@@ -326,8 +385,14 @@ def start(
     mode = get_mode()
     ctx = build_context()
 
-    all_projects = ctx.api.get_projects(ctx.workspace_id)
+    ctx.prefetch_meta()
+    all_projects = ctx.projects
+    all_tags = ctx.tags
+
     matches = fuzzy_search(project, all_projects, key=lambda p: p.name)
+    if not _is_exact(matches, project):
+        all_projects = ctx.api.get_projects(ctx.workspace_id, fresh=True)
+        matches = fuzzy_search(project, all_projects, key=lambda p: p.name)
     if not matches:
         print_error(f"clocky: No projects matching '{project}'")
         raise typer.Exit(2)
@@ -335,10 +400,8 @@ def start(
     if not chosen:
         raise typer.Exit(0)
 
-    if not mode.quiet:
-        console.print(f"[dim]Project:[/dim] [cyan]{chosen.name}[/cyan]")
+    _log(f"[dim]Project:[/dim] [cyan]{chosen.name}[/cyan]")
 
-    all_tags = ctx.api.get_tags(ctx.workspace_id)
     tag_ids = _resolve_tag_ids(
         ctx.api,
         ctx.workspace_id,
@@ -347,12 +410,12 @@ def start(
         chosen.name,
         tags,
         all_tags,
+        ctx.tag_name_by_id,
         auto_tag=auto_tag,
         non_interactive=non_interactive,
     )
 
-    tag_map = {t.id: t.name for t in all_tags}
-    tag_names = [tag_map.get(tid, tid) for tid in tag_ids]
+    tag_names = [ctx.tag_name_by_id.get(tid, tid) for tid in tag_ids]
 
     if dry_run:
         result = {
@@ -366,11 +429,11 @@ def start(
         if mode.json:
             emit_json(result)
         else:
-            console.print("\n[bold yellow]Dry run[/bold yellow] — no timer started.")
-            console.print(f"  Project:     [cyan]{chosen.name}[/cyan]")
-            console.print(f"  Description: {description or '[dim]—[/dim]'}")
+            _console().print("\n[bold yellow]Dry run[/bold yellow] — no timer started.")
+            _console().print(f"  Project:     [cyan]{chosen.name}[/cyan]")
+            _console().print(f"  Description: {description or '[dim]—[/dim]'}")
             tags_str = ", ".join(tag_names) if tag_names else "[dim]—[/dim]"
-            console.print(f"  Tags:        [magenta]{tags_str}[/magenta]\n")
+            _console().print(f"  Tags:        [magenta]{tags_str}[/magenta]\n")
         return
 
     request = StartTimerRequest(
@@ -414,22 +477,22 @@ def stop(
         if running.time_interval.start.tzinfo
         else running.time_interval.start.replace(tzinfo=UTC)
     )
-    if elapsed.total_seconds() > 8 * 3600 and not force and sys.stdin.isatty() and not mode.quiet:
+    if elapsed.total_seconds() > 8 * 3600 and not force and _STDIN_IS_TTY and not mode.quiet:
         from clocky.display import format_duration
 
         confirm = typer.confirm(f"Timer has been running for {format_duration(elapsed)}. Stop it?")
         if not confirm:
             raise typer.Exit(0)
 
+    if mode.json and (running.project_id or running.tag_ids):
+        ctx.prefetch_meta()  # resolve names while the stop request is in flight
     entry = ctx.api.stop_timer(ctx.workspace_id, ctx.user.id, StopTimerRequest(end=_now_utc()))
 
     if mode.json:
         project_name = None
         if entry.project_id:
-            projects_map = {p.id: p.name for p in ctx.api.get_projects(ctx.workspace_id)}
-            project_name = projects_map.get(entry.project_id)
-        tag_map = {t.id: t.name for t in ctx.api.get_tags(ctx.workspace_id)}
-        tag_names = [tag_map.get(tid, tid) for tid in entry.tag_ids]
+            project_name = ctx.project_name_by_id.get(entry.project_id)
+        tag_names = [ctx.tag_name_by_id.get(tid, tid) for tid in entry.tag_ids]
         emit_json(time_entry_to_dict(entry, project_name=project_name, tag_names=tag_names))
         return
 
@@ -443,9 +506,9 @@ def list_entries(
     """List recent time entries."""
     mode = get_mode()
     ctx = build_context()
+    ctx.prefetch_meta()
     entries = ctx.api.get_time_entries(ctx.workspace_id, ctx.user.id, limit=limit)
-    project_map = {p.id: p.name for p in ctx.api.get_projects(ctx.workspace_id)}
-    tag_map = {t.id: t.name for t in ctx.api.get_tags(ctx.workspace_id)}
+    project_map, tag_map = ctx.project_name_by_id, ctx.tag_name_by_id
 
     if mode.json:
         result = [
@@ -474,9 +537,10 @@ def projects(
     ctx = build_context()
 
     client_label: str | None = None
-    all_projects = ctx.api.get_projects(ctx.workspace_id)
 
-    if client:
+    if not client:
+        all_projects = ctx.api.get_projects(ctx.workspace_id)
+    else:
         clients = ctx.api.get_clients(ctx.workspace_id)
         client_matches = fuzzy_search(client, clients, key=lambda c: c.name)
         if not client_matches:
@@ -487,7 +551,7 @@ def projects(
             raise typer.Exit(0)
 
         client_label = chosen_client.name
-        all_projects = [p for p in all_projects if p.client_id == chosen_client.id]
+        all_projects = ctx.api.get_projects(ctx.workspace_id, client_ids=[chosen_client.id])
 
     if search:
         proj_matches = fuzzy_search(search, all_projects, key=lambda p: p.name)
@@ -525,7 +589,7 @@ def delete(
     mode = get_mode()
     ctx = build_context()
 
-    if not force and sys.stdin.isatty() and not mode.quiet:
+    if not force and _STDIN_IS_TTY and not mode.quiet:
         confirm = typer.confirm(f"Delete time entry {entry_id}?")
         if not confirm:
             raise typer.Exit(0)
@@ -543,7 +607,7 @@ def delete(
 # Register subcommands at import time so they also appear in `--help`.
 from clocky.cli_tag_map import register as _register_tag_map  # noqa: E402
 
-_register_tag_map(app, console)
+_register_tag_map(app, _console)
 
 
 def main() -> None:
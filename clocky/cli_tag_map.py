@@ -6,11 +6,11 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-import questionary
 import typer
+from pydantic_core import from_json, to_json
 
 from clocky.context import build_context
 from clocky.fuzzy import fuzzy_choices, fuzzy_search
@@ -20,26 +20,12 @@ if TYPE_CHECKING:
     from rich.console import Console
 
 
-def _name_for_id(items: list[Any], id_: str) -> str:
-    """Return the ``name`` of the first item whose ``id`` matches, or ``id_`` as fallback.
-
-    Args:
-        items: Objects with ``.id`` and ``.name`` attributes.
-        id_: The ID to look up.
-
-    Returns:
-        Matching name, or ``id_`` when no match is found.
-
-    """
-    return next((x.name for x in items if x.id == id_), id_)
-
-
-def register(app: typer.Typer, console: Console) -> None:
+def register(app: typer.Typer, console: Callable[[], Console]) -> None:
     """Register tag-map subcommands.
 
     Args:
         app: Parent Typer app.
-        console: Rich console for output.
+        console: Factory returning the Rich console for output (called lazily).
 
     """
     tag_app = typer.Typer(help="Manage the persisted project→tag mapping.")
@@ -53,8 +39,7 @@ def register(app: typer.Typer, console: Console) -> None:
         names for readability.
         """
         ctx = build_context()
-        projects = {p.id: p.name for p in ctx.api.get_projects(ctx.workspace_id)}
-        tags = {t.id: t.name for t in ctx.api.get_tags(ctx.workspace_id)}
+        projects, tags = ctx.project_name_by_id, ctx.tag_name_by_id
 
         mapping = TagMap.load().project_to_tag
         resolved = {
@@ -62,8 +47,8 @@ def register(app: typer.Typer, console: Console) -> None:
             for project_id, tag_id in mapping.items()
         }
 
-        console.print(json.dumps(resolved, indent=2, sort_keys=True, ensure_ascii=False))
-        console.print(f"\n[dim]Path:[/dim] {tag_map_path()}")
+        console().print(to_json(dict(sorted(resolved.items())), indent=2).decode())
+        console().print(f"\n[dim]Path:[/dim] {tag_map_path()}")
 
     @tag_app.command("edit")
     def edit() -> None:
@@ -73,20 +58,25 @@ def register(app: typer.Typer, console: Console) -> None:
         if not path.exists():
             path.write_text("{}\n", encoding="utf-8")
 
-        edited = typer.edit(path.read_text(encoding="utf-8"))
+        import click  # newer typer releases no longer re-export click.edit
+
+        edited = click.edit(path.read_text(encoding="utf-8"))
         if edited is None:
             return
 
         try:
-            data = json.loads(edited)
-        except json.JSONDecodeError as e:
+            data = from_json(edited)
+        except ValueError as e:
             raise typer.BadParameter(f"Invalid JSON: {e}") from e
 
         if not isinstance(data, dict):
             raise typer.BadParameter("Tag map must be a JSON object (project_id -> tag_id)")
 
-        TagMap(project_to_tag={str(k): str(v) for k, v in data.items()}).save()
-        console.print("[green]Saved.[/green]")
+        # JSON object keys are always strings; only coerce values when needed.
+        if not all(type(v) is str for v in data.values()):
+            data = {k: str(v) for k, v in data.items()}
+        TagMap(project_to_tag=data).save()
+        console().print("[green]Saved.[/green]")
 
     @tag_app.command("set")
     def set_mapping(project_id: str, tag_id: str) -> None:
@@ -95,15 +85,13 @@ def register(app: typer.Typer, console: Console) -> None:
         Note: this command accepts IDs. Prefer `clocky tag-map pick` for a
         name-based interactive flow.
         """
-        TagMap.load().set(project_id, tag_id).save()
+        TagMap.load().set(project_id, tag_id).save_if_dirty()
 
         ctx = build_context()
-        projects = ctx.api.get_projects(ctx.workspace_id)
-        tags = ctx.api.get_tags(ctx.workspace_id)
-        project_name = _name_for_id(projects, project_id)
-        tag_name = _name_for_id(tags, tag_id)
+        project_name = ctx.project_name_by_id.get(project_id, project_id)
+        tag_name = ctx.tag_name_by_id.get(tag_id, tag_id)
 
-        console.print(f"[green]Mapped[/green] {project_name} → {tag_name}")
+        console().print(f"[green]Mapped[/green] {project_name} → {tag_name}")
 
     @tag_app.command("pick")
     def pick() -> None:
@@ -111,10 +99,11 @@ def register(app: typer.Typer, console: Console) -> None:
 
         Uses fuzzy search + an interactive picker.
         """
+        import questionary
+
         ctx = build_context()
 
-        projects = ctx.api.get_projects(ctx.workspace_id)
-        tags = ctx.api.get_tags(ctx.workspace_id)
+        projects, tags = ctx.projects, ctx.tags
 
         project_query = typer.prompt("Project (fuzzy)").strip()
         project_matches = fuzzy_search(project_query, projects, key=lambda p: p.name)
@@ -136,21 +125,19 @@ def register(app: typer.Typer, console: Console) -> None:
         if not chosen_tag:
             return
 
-        TagMap.load().set(chosen_project.id, chosen_tag.id).save()
-        console.print(f"[green]Mapped[/green] {chosen_project.name} → {chosen_tag.name}")
+        TagMap.load().set(chosen_project.id, chosen_tag.id).save_if_dirty()
+        console().print(f"[green]Mapped[/green] {chosen_project.name} → {chosen_tag.name}")
 
     @tag_app.command("remove")
     def remove(project_id: str) -> None:
         """Remove mapping for a project id."""
-        mapping = TagMap.load().project_to_tag
-        if project_id not in mapping:
-            console.print("[dim]No mapping for that project id.[/dim]")
+        tag_map = TagMap.load().unset(project_id)
+        if not tag_map.dirty:
+            console().print("[dim]No mapping for that project id.[/dim]")
             return
 
         ctx = build_context()
-        projects = ctx.api.get_projects(ctx.workspace_id)
-        project_name = _name_for_id(projects, project_id)
+        project_name = ctx.project_name_by_id.get(project_id, project_id)
 
-        mapping.pop(project_id)
-        TagMap(project_to_tag=mapping).save()
-        console.print(f"[green]Removed[/green] mapping for {project_name}")
+        tag_map.save()
+        console().print(f"[green]Removed[/green] mapping for {project_name}")
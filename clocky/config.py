@@ -6,51 +6,58 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
-from pydantic import field_validator
-from pydantic_settings import BaseSettings
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm
+from pydantic import BaseModel, field_validator
 
 # Re-exported so that existing callers (including tests) can import from here.
 from clocky.browser import CLOCKIFY_API_KEY_URL
 from clocky.browser import open_browser as _open_browser
+from clocky.console import console as _console
+from clocky.console import err_console as _err_console
+from clocky.paths import env_file
 
 __all__ = ["CLOCKIFY_API_KEY_URL", "_open_browser", "Settings", "load_settings"]
 
-_console = Console()
-_err_console = Console(stderr=True)
-
 
 def _find_env_file() -> Path:
     """Find .env file in standard locations.
 
     Search order:
+    0. ``$CLOCKY_ENV_FILE`` if set (no filesystem lookup at all)
     1. Current working directory (and parents)
     2. ~/.config/clocky/.env
     3. ~/.clocky.env
 
     Returns the first found, or ~/.config/clocky/.env as the default location.
+    Only regular files match, so a virtualenv directory named ``.env`` is skipped.
     """
-    # Search upward from cwd
-    cwd = Path.cwd()
-    for directory in [cwd, *cwd.parents]:
-        candidate = directory / ".env"
-        if candidate.exists():
-            return candidate
+    override = os.environ.get("CLOCKY_ENV_FILE")
+    if override:
+        return Path(override).expanduser()
+
+    # Search upward from cwd on plain strings: one stat per level, no Path objects
+    directory = os.getcwd()
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return Path(candidate)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
 
     # Check XDG config location
-    xdg_config = Path.home() / ".config" / "clocky" / ".env"
-    if xdg_config.exists():
+    xdg_config = env_file()
+    if os.path.isfile(xdg_config):
         return xdg_config
 
     # Check home directory
     home_env = Path.home() / ".clocky.env"
-    if home_env.exists():
+    if os.path.isfile(home_env):
         return home_env
 
     # Default to XDG config location
@@ -59,17 +66,21 @@ def _find_env_file() -> Path:
 
 def _prompt_open_browser() -> None:
     """Offer to open the Clockify API key page."""
-    _console.print(f"\n  [bold cyan]Direct link:[/bold cyan] {CLOCKIFY_API_KEY_URL}")
+    from rich.prompt import Confirm
+
+    _console().print(f"\n  [bold cyan]Direct link:[/bold cyan] {CLOCKIFY_API_KEY_URL}")
     try:
         if Confirm.ask("\n  Open in browser?", default=True):
             _open_browser(CLOCKIFY_API_KEY_URL)
-            _console.print("  [dim]Browser opened.[/dim]")
+            _console().print("  [dim]Browser opened.[/dim]")
     except (KeyboardInterrupt, EOFError):
         pass  # Non-interactive
 
 
 def _show_setup_guide(env_path: Path, *, file_exists: bool) -> None:
     """Show first-run setup instructions."""
+    from rich.panel import Panel
+
     if file_exists:
         title = "[bold red]⚠  API key not set[/bold red]"
         body = (
@@ -92,19 +103,43 @@ def _show_setup_guide(env_path: Path, *, file_exists: bool) -> None:
             "  4. Generate or copy your key and update the file"
         )
 
-    _err_console.print()
-    _err_console.print(Panel(body, title=title, border_style="red", padding=(1, 2)))
+    err_console = _err_console()
+    err_console.print()
+    err_console.print(Panel(body, title=title, border_style="red", padding=(1, 2)))
     _prompt_open_browser()
-    _err_console.print()
+    err_console.print()
 
 
-class Settings(BaseSettings):
-    """App settings from environment / .env file."""
+def _parse_env(path: Path) -> dict[str, str]:
+    """Parse ``KEY=VALUE`` lines from a ``.env`` file.
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
+    Blank lines, ``#`` comments and an optional ``export`` prefix are skipped.
+    Quoted values are taken verbatim; unquoted ones lose a trailing `` # comment``.
+    """
+    values: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        key, sep, value = line.removeprefix("export ").partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) > 1 and value[0] in "\"'" and value[0] in value[1:]:
+            value = value[1 : value.index(value[0], 1)]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.strip()] = value
+    return values
+
+
+class Settings(BaseModel):
+    """App settings from environment / .env file."""
 
     clockify_api_key: str
     clockify_workspace_id: str = ""
+    # Long enough to matter only because `start` refetches on any non-exact name.
+    clocky_cache_ttl: float = 600.0
 
     @field_validator("clockify_api_key")
     @classmethod
@@ -116,15 +151,22 @@ class Settings(BaseSettings):
         return v
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Load settings from .env, with helpful guidance on failure."""
-    env_path = _find_env_file()
+    """Load settings from .env, with helpful guidance on failure.
 
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path, override=False)
+    The result is memoised for the life of the process, so the ``.env`` search
+    and parse happen once; call ``load_settings.cache_clear()`` to reload.
+    """
+    env_path = _find_env_file()
 
+    # Field names match variable names case-insensitively; real environment
+    # variables win over the file, and the file never leaks into os.environ.
     try:
-        return Settings(_env_file=env_path)  # type: ignore[call-arg]
+        raw = _parse_env(env_path) if os.path.isfile(env_path) else {}
+        raw.update(os.environ)
+        values = {k.lower(): v for k, v in raw.items() if k.lower() in Settings.model_fields}
+        return Settings(**values)
     except Exception:
         _show_setup_guide(env_path, file_exists=env_path.exists())
         sys.exit(1)
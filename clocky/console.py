@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: MIT
+"""Shared Rich consoles for clocky-cli output.
+
+SPDX-License-Identifier: MIT
+
+Each ``Console`` probes the terminal (isatty, ``TERM``, ``COLUMNS``, locale)
+when built, so every module shares one stdout and one stderr console, created
+on first use rather than at import time.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def console() -> Console:
+    """Return the shared stdout console."""
+    from rich.console import Console
+
+    return Console(no_color=bool(os.environ.get("NO_COLOR")))
+
+
+@cache
+def err_console() -> Console:
+    """Return the shared stderr console."""
+    from rich.console import Console
+
+    return Console(stderr=True, no_color=bool(os.environ.get("NO_COLOR")))
@@ -5,20 +5,64 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
 
 from clocky.api import ClockifyAPI
 from clocky.config import load_settings
-from clocky.models import User
+from clocky.models import Project, Tag, User
 
 
 @dataclass
 class AppContext:
-    """Holds API client, user, and workspace ID for the session."""
+    """Holds API client, user, and workspace ID for the session.
+
+    Workspace projects and tags are fetched lazily, at most once per context,
+    so commands that need several lookups share a single request.
+    """
 
     api: ClockifyAPI
     user: User
     workspace_id: str
+    _pending: dict[str, Future[Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def prefetch_meta(self) -> None:
+        """Start fetching projects and tags in the background.
+
+        Returns immediately; :attr:`projects` and :attr:`tags` wait for these
+        requests on first access, so their round-trips overlap with each other
+        and with whatever the command does in between.
+        """
+        pool = ThreadPoolExecutor(max_workers=2)
+        self._pending["projects"] = pool.submit(self.api.get_projects, self.workspace_id)
+        self._pending["tags"] = pool.submit(self.api.get_tags, self.workspace_id)
+        pool.shutdown(wait=False)
+
+    @cached_property
+    def projects(self) -> list[Project]:
+        """All projects in the workspace."""
+        pending = self._pending.pop("projects", None)
+        return pending.result() if pending else self.api.get_projects(self.workspace_id)
+
+    @cached_property
+    def tags(self) -> list[Tag]:
+        """All tags in the workspace."""
+        pending = self._pending.pop("tags", None)
+        return pending.result() if pending else self.api.get_tags(self.workspace_id)
+
+    @cached_property
+    def project_name_by_id(self) -> dict[str, str]:
+        """Project ID → name."""
+        return {p.id: p.name for p in self.projects}
+
+    @cached_property
+    def tag_name_by_id(self) -> dict[str, str]:
+        """Tag ID → name."""
+        return {t.id: t.name for t in self.tags}
 
 
 def build_context() -> AppContext:
@@ -27,7 +71,7 @@ def build_context() -> AppContext:
     Uses CLOCKIFY_WORKSPACE_ID from config if set, otherwise the user's default.
     """
     settings = load_settings()
-    api = ClockifyAPI(api_key=settings.clockify_api_key)
+    api = ClockifyAPI(api_key=settings.clockify_api_key, cache_ttl=settings.clocky_cache_ttl)
     user = api.get_user()
     workspace_id = settings.clockify_workspace_id or user.default_workspace
     return AppContext(api=api, user=user, workspace_id=workspace_id)
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MIT
+"""Optional background daemon that answers CLI requests from a warm process.
+
+SPDX-License-Identifier: MIT
+
+``clocky daemon`` keeps one authenticated ``ClockifyAPI`` (and its open TLS
+connection) alive behind a Unix socket. Commands that support it send a single
+newline-delimited JSON request and fall back to in-process execution whenever
+the socket is missing, unreachable, or replies with an error.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from clocky.paths import cache_dir
+
+if TYPE_CHECKING:
+    from socketserver import UnixStreamServer
+
+#: Seconds to wait for the daemon before falling back to in-process execution.
+#: Well below the API's own 10 s timeout, so a daemon stuck on a slow Clockify
+#: call delays other commands briefly instead of for the full API timeout.
+REQUEST_TIMEOUT = 2.0
+
+Handler = Callable[[dict[str, Any]], Any]
+
+
+def socket_path() -> Path:
+    """Return the daemon socket path (``$XDG_RUNTIME_DIR/clocky.sock``)."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    return (Path(runtime_dir) if runtime_dir else cache_dir()) / "clocky.sock"
+
+
+def request(cmd: str, **args: Any) -> Any | None:
+    """Send *cmd* to a running daemon and return its result.
+
+    Args:
+        cmd: Command name registered with :func:`serve`.
+        **args: Extra JSON-serialisable request fields.
+
+    Returns:
+        The daemon's result, or ``None`` when no daemon answered successfully.
+
+    """
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(REQUEST_TIMEOUT)
+            sock.connect(str(path))
+            sock.sendall(json.dumps({"cmd": cmd, **args}).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                reply = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    return reply.get("result") if reply.get("ok") else None
+
+
+def _is_live(path: Path) -> bool:
+    """Return True if something is accepting connections on *path*."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def make_server(handlers: dict[str, Handler], path: Path | None = None) -> UnixStreamServer:
+    """Bind a Unix socket server that dispatches requests to *handlers*.
+
+    Requests are handled one at a time, so handlers may share a single
+    ``ClockifyAPI`` without locking. Handler exceptions are reported to the
+    client as ``{"ok": false}`` replies, which makes it fall back.
+
+    Args:
+        handlers: Map of command name to a callable taking the request dict.
+        path: Socket path; defaults to :func:`socket_path`.
+
+    Returns:
+        The bound (not yet serving) server.
+
+    Raises:
+        RuntimeError: If another daemon is already listening on *path*.
+
+    """
+    from socketserver import StreamRequestHandler, UnixStreamServer
+
+    path = path or socket_path()
+    if path.exists():
+        if _is_live(path):
+            raise RuntimeError(f"clocky daemon already running on {path}")
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    class _Handler(StreamRequestHandler):
+        def handle(self) -> None:
+            line = self.rfile.readline()
+            if not line:
+                return  # liveness probe, or the client gave up before sending
+            try:
+                req = json.loads(line)
+                reply = {"ok": True, "result": handlers[req["cmd"]](req)}
+            except Exception as e:  # any failure means "fall back"
+                reply = {"ok": False, "error": str(e)}
+            try:
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+            except OSError:
+                pass  # client timed out or disconnected; it has already fallen back
+
+    # Create the socket owner-only from the start rather than chmod after bind.
+    old_umask = os.umask(0o177)
+    try:
+        return UnixStreamServer(str(path), _Handler)
+    finally:
+        os.umask(old_umask)
+
+
+def serve(handlers: dict[str, Handler], path: Path | None = None) -> None:
+    """Serve *handlers* on a Unix socket until interrupted, then remove it.
+
+    Args:
+        handlers: Map of command name to a callable taking the request dict.
+        path: Socket path; defaults to :func:`socket_path`.
+
+    """
+    path = path or socket_path()
+    with make_server(handlers, path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
@@ -6,26 +6,38 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import os
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 from rich import box
-from rich.console import Console
 from rich.table import Table
 
+from clocky.console import console, err_console
 from clocky.models import Project, TimeEntry
 
-_no_color = bool(os.environ.get("NO_COLOR"))
-console = Console(no_color=_no_color)
-err_console = Console(stderr=True, no_color=_no_color)
+# Fixed table schemas: (header, add_column kwargs), built once at import.
+_ENTRY_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Date", {"style": "dim", "no_wrap": True}),
+    ("Project", {"style": "cyan"}),
+    ("Tags", {"style": "magenta"}),
+    ("Description", {}),
+    ("Duration", {"justify": "right", "style": "yellow"}),
+)
+_PROJECT_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("ID", {"style": "dim", "no_wrap": True}),
+    ("Name", {"style": "cyan"}),
+    ("Client", {"style": "magenta"}),
+)
 
 
 def format_duration(delta: timedelta) -> str:
     """Format a timedelta as 'Xh Ym Zs'."""
-    total = int(delta.total_seconds())
-    hours, remainder = divmod(total, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours}h {minutes}m {seconds}s"
+    # Integer fields only, no float round-trip; truncates toward zero like int().
+    total = delta.days * 86400 + delta.seconds
+    if total < 0 and delta.microseconds:
+        total += 1
+    # Plain // and % skip divmod's tuple allocations; same floor semantics.
+    return f"{total // 3600}h {total // 60 % 60}m {total % 60}s"
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -33,6 +45,11 @@ def _ensure_utc(dt: datetime) -> datetime:
     return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
 
 
+def _format_minute(dt: datetime) -> str:
+    """Format as ``YYYY-MM-DD HH:MM`` (``isoformat`` skips strftime's format parsing)."""
+    return dt.isoformat(" ", "minutes")[:16]
+
+
 def _get_elapsed(start: datetime) -> str:
     """Get elapsed time from start until now."""
     return format_duration(datetime.now(UTC) - _ensure_utc(start))
@@ -42,16 +59,23 @@ def _get_duration(entry: TimeEntry) -> str:
     """Get duration string for a time entry."""
     interval = entry.time_interval
     if interval.end:
-        delta = _ensure_utc(interval.end) - _ensure_utc(interval.start)
-        return format_duration(delta)
+        return format_duration(_ensure_utc(interval.end) - _ensure_utc(interval.start))
     return interval.duration or "—"
 
 
+def _new_table(title: str, columns: tuple[tuple[str, dict[str, Any]], ...]) -> Table:
+    """Create a rounded, highlighted table with the given column schema."""
+    table = Table(title=title, box=box.ROUNDED, highlight=True)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
 def _print_table(table: Table) -> None:
     """Print a Rich table surrounded by blank lines."""
-    console.print()
-    console.print(table)
-    console.print()
+    console().print()
+    console().print(table)
+    console().print()
 
 
 # -----------------------------------------------------------------------------
@@ -64,20 +88,20 @@ def print_status(entry: TimeEntry, project_name: str | None) -> None:
     elapsed = _get_elapsed(entry.time_interval.start)
     project = f"[bold cyan]{project_name}[/bold cyan]" if project_name else "[dim]No project[/dim]"
     desc = entry.description or "[dim]No description[/dim]"
-    started = entry.time_interval.start.strftime("%Y-%m-%d %H:%M:%S")
+    started = entry.time_interval.start.isoformat(" ", "seconds")[:19]
 
-    console.print()
-    console.print("[bold green]⏱  Timer running[/bold green]")
-    console.print(f"  Project:     {project}")
-    console.print(f"  Description: {desc}")
-    console.print(f"  Started:     {started} UTC")
-    console.print(f"  Elapsed:     [bold yellow]{elapsed}[/bold yellow]")
-    console.print()
+    console().print()
+    console().print("[bold green]⏱  Timer running[/bold green]")
+    console().print(f"  Project:     {project}")
+    console().print(f"  Description: {desc}")
+    console().print(f"  Started:     {started} UTC")
+    console().print(f"  Elapsed:     [bold yellow]{elapsed}[/bold yellow]")
+    console().print()
 
 
 def print_no_timer() -> None:
     """Print message when no timer is running."""
-    console.print("\n[dim]No timer is currently running.[/dim]\n")
+    console().print("\n[dim]No timer is currently running.[/dim]\n")
 
 
 def print_timer_stopped(entry: TimeEntry) -> None:
@@ -100,15 +124,10 @@ def print_time_entries(
 
     """
     if not entries:
-        console.print("\n[dim]No time entries found.[/dim]\n")
+        console().print("\n[dim]No time entries found.[/dim]\n")
         return
 
-    table = Table(title="Recent Time Entries", box=box.ROUNDED, highlight=True)
-    table.add_column("Date", style="dim", no_wrap=True)
-    table.add_column("Project", style="cyan")
-    table.add_column("Tags", style="magenta")
-    table.add_column("Description")
-    table.add_column("Duration", justify="right", style="yellow")
+    table = _new_table("Recent Time Entries", _ENTRY_COLUMNS)
 
     tag_map = tag_map or {}
 
@@ -119,7 +138,7 @@ def print_time_entries(
             tags = ", ".join(names)
 
         table.add_row(
-            entry.time_interval.start.strftime("%Y-%m-%d %H:%M"),
+            _format_minute(entry.time_interval.start),
             project_map.get(entry.project_id or "", "—"),
             tags,
             entry.description or "—",
@@ -132,14 +151,11 @@ def print_time_entries(
 def print_projects(projects: list[Project], client_filter: str | None = None) -> None:
     """Print a table of projects."""
     if not projects:
-        console.print("\n[dim]No projects found.[/dim]\n")
+        console().print("\n[dim]No projects found.[/dim]\n")
         return
 
     title = f"Projects — {client_filter}" if client_filter else "Projects"
-    table = Table(title=title, box=box.ROUNDED, highlight=True)
-    table.add_column("ID", style="dim", no_wrap=True)
-    table.add_column("Name", style="cyan")
-    table.add_column("Client", style="magenta")
+    table = _new_table(title, _PROJECT_COLUMNS)
 
     for p in projects:
         table.add_row(p.id, p.name, p.client_name or "—")
@@ -149,9 +165,9 @@ def print_projects(projects: list[Project], client_filter: str | None = None) ->
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"\n[bold green]✔[/bold green] {message}\n")
+    console().print(f"\n[bold green]✔[/bold green] {message}\n")
 
 
 def print_error(message: str) -> None:
     """Print an error message to stderr."""
-    err_console.print(f"\n[bold red]✘[/bold red] {message}\n")
+    err_console().print(f"\n[bold red]✘[/bold red] {message}\n")
@@ -6,14 +6,39 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
 
-import questionary
-from rapidfuzz import fuzz, process
+from rapidfuzz import fuzz, process, utils
+
+if TYPE_CHECKING:
+    import questionary
 
 DEFAULT_CUTOFF = 40
 DEFAULT_LIMIT = 10
 
+# token_set_ratio ranks "Data Pipe New" above "Data Pipeline" for "Data Pipe";
+# default_process lowercases and strips punctuation so "app" finds "Mobile App".
+_SCORER: Callable[..., Any] = fuzz.token_set_ratio
+_PROCESSOR = utils.default_process
+
+
+def _literal_hits(query: str, names: Sequence[str]) -> int | dict[int, int]:
+    """Case-insensitive literal checks run alongside fuzzy scoring.
+
+    Returns:
+        The index of the single exact match if there is one, otherwise a map
+        from index to tie-break rank: 0 for names starting with *query*, 1 for
+        names merely containing it (possibly empty).
+
+    """
+    low = query.casefold()
+    folded = [n.casefold() for n in names]
+    exact = [i for i, n in enumerate(folded) if n == low]
+    if len(exact) == 1:
+        return exact[0]
+    return {i: 0 if n.startswith(low) else 1 for i, n in enumerate(folded) if low in n}
+
 
 def fuzzy_search[T](
     query: str,
@@ -22,15 +47,25 @@ def fuzzy_search[T](
     *,
     cutoff: float = DEFAULT_CUTOFF,
     limit: int = DEFAULT_LIMIT,
+    names: Sequence[str] | None = None,
+    scorer: Callable[..., Any] = _SCORER,
 ) -> list[tuple[T, float]]:
     """Fuzzy-search a list of objects.
 
+    A unique case-insensitive exact match is returned alone with score 100.
+    Otherwise every item is scored and filtered by *cutoff*; among equal
+    scores, names starting with the query rank first, then names containing it.
+
     Args:
         query: Search string (may be misspelled).
         items: Objects to search through.
         key: Function to extract the searchable string from each item.
         cutoff: Minimum score (0–100) to include a result.
         limit: Maximum results to return.
+        names: Precomputed ``key(item)`` for every item, in order. Pass this
+            when searching the same items repeatedly to skip re-extraction.
+        scorer: rapidfuzz scorer (e.g. ``fuzz.WRatio``); defaults to
+            ``fuzz.token_set_ratio``.
 
     Returns:
         List of (item, score) tuples, sorted by descending score.
@@ -40,14 +75,24 @@ def fuzzy_search[T](
     if not query:
         return [(item, 100.0) for item in items]
 
-    choices = {i: key(item) for i, item in enumerate(items)}
+    if names is None:
+        names = [key(item) for item in items]
+    hit = _literal_hits(query, names)
+    if isinstance(hit, int):
+        return [(items[hit], 100.0)]
+
     results = process.extract(
         query,
-        choices,
-        scorer=fuzz.token_set_ratio,
+        names,
+        scorer=scorer,
+        processor=_PROCESSOR,
         score_cutoff=cutoff,
-        limit=limit,
+        limit=None if hit else limit,
     )
+    if hit:
+        # Stable sort: literal hits move ahead only of equally scored names.
+        results.sort(key=lambda r: (-r[1], hit.get(r[2], 2)))
+        del results[limit:]
     return [(items[idx], score) for (_, score, idx) in results]
 
 
@@ -57,10 +102,37 @@ def fuzzy_best[T](
     key: Callable[[T], str],
     *,
     cutoff: float = DEFAULT_CUTOFF,
+    scorer: Callable[..., Any] = _SCORER,
 ) -> T | None:
-    """Return the single best fuzzy match, or None if nothing meets the cutoff."""
-    results = fuzzy_search(query, items, key, cutoff=cutoff, limit=1)
-    return results[0][0] if results else None
+    """Return the single best fuzzy match, or None if nothing meets the cutoff.
+
+    Ranks like :func:`fuzzy_search` with ``limit=1``, but uses
+    ``process.extractOne`` so no result list is built for a single pick.
+    *scorer* is passed through as in :func:`fuzzy_search`.
+    """
+    if not query:
+        return items[0] if items else None
+
+    names = [key(item) for item in items]
+    hit = _literal_hits(query, names)
+    if isinstance(hit, int):
+        return items[hit]
+
+    best = process.extractOne(
+        query,
+        names,
+        scorer=scorer,
+        processor=_PROCESSOR,
+        score_cutoff=cutoff,
+    )
+    if best is None:
+        return None
+    rank = hit.get(best[2], 2)
+    # A better-ranked literal hit tied with the top score wins, as in fuzzy_search.
+    for i in sorted((i for i in hit if hit[i] < rank), key=lambda i: (hit[i], i)):
+        if scorer(query, names[i], processor=_PROCESSOR) >= best[1]:
+            return items[i]
+    return items[best[2]]
 
 
 def fuzzy_choices[T](
@@ -77,6 +149,8 @@ def fuzzy_choices[T](
         List of ``questionary.Choice`` objects annotated with match percentage.
 
     """
+    import questionary
+
     return [
         questionary.Choice(f"{getattr(item, attr)} ({score:.0f}%)", value=item)
         for item, score in matches
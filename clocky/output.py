@@ -6,11 +6,12 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
 import sys
 from dataclasses import dataclass
 from typing import Any
 
+from pydantic_core import to_json
+
 from clocky.models import TimeEntry
 
 
@@ -49,7 +50,16 @@ def emit_json(data: Any) -> None:
         data: Serializable object (dict, list, etc.).
 
     """
-    sys.stdout.write(json.dumps(data, indent=2, ensure_ascii=False, default=str) + "\n")
+    # pydantic-core's Rust encoder: same bytes as json.dumps(indent=2, ensure_ascii=False).
+    payload = to_json(data, indent=2, fallback=str)
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(payload.decode() + "\n")
+        return
+    # Already UTF-8 bytes: skip the text layer's decode/encode round-trip.
+    out.flush()
+    buffer.write(payload + b"\n")
 
 
 def time_entry_to_dict(
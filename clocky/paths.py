@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MIT
+"""Well-known clocky file locations.
+
+SPDX-License-Identifier: MIT
+
+These are functions rather than module constants so that ``HOME`` is read when
+a path is needed, not frozen at import time.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def config_dir() -> Path:
+    """Return the clocky config directory (``~/.config/clocky``)."""
+    return Path.home() / ".config" / "clocky"
+
+
+def env_file() -> Path:
+    """Return the default settings file (``~/.config/clocky/.env``)."""
+    return config_dir() / ".env"
+
+
+def tag_map_file() -> Path:
+    """Return the persisted project→tag map (``~/.config/clocky/tag-map.json``)."""
+    return config_dir() / "tag-map.json"
+
+
+def cache_dir() -> Path:
+    """Return the directory holding cached API responses (``~/.cache/clocky``)."""
+    return Path.home() / ".cache" / "clocky"
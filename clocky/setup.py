@@ -6,22 +6,18 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from pathlib import Path
-
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
 from clocky.browser import CLOCKIFY_API_KEY_URL, open_browser
-
-CONFIG_DIR = Path.home() / ".config" / "clocky"
-ENV_FILE = CONFIG_DIR / ".env"
-
-console = Console()
+from clocky.console import console as shared_console
+from clocky.paths import config_dir, env_file
 
 
 def setup() -> None:
     """Run interactive setup to configure clocky."""
+    console = shared_console()
+    env_path = env_file()
     console.print()
     console.print(
         Panel(
@@ -32,10 +28,10 @@ def setup() -> None:
     )
 
     # Check if already configured
-    if ENV_FILE.exists():
-        content = ENV_FILE.read_text()
+    if env_path.exists():
+        content = env_path.read_text()
         if "CLOCKIFY_API_KEY=" in content and "your_api_key_here" not in content:
-            console.print(f"\n[green]✓[/green] Config already exists at: [dim]{ENV_FILE}[/dim]")
+            console.print(f"\n[green]✓[/green] Config already exists at: [dim]{env_path}[/dim]")
             if not Confirm.ask("Overwrite existing configuration?", default=False):
                 console.print("[dim]Setup cancelled.[/dim]\n")
                 return
@@ -61,16 +57,16 @@ def setup() -> None:
     workspace_id = Prompt.ask("  Workspace ID", default="").strip()
 
     # Create config directory and file
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    config_dir().mkdir(parents=True, exist_ok=True)
 
     env_content = f"CLOCKIFY_API_KEY={api_key}\n"
     if workspace_id:
         env_content += f"CLOCKIFY_WORKSPACE_ID={workspace_id}\n"
 
-    ENV_FILE.write_text(env_content)
-    ENV_FILE.chmod(0o600)  # Secure permissions
+    env_path.write_text(env_content)
+    env_path.chmod(0o600)  # Secure permissions
 
-    console.print(f"\n[green]✓[/green] Configuration saved to: [dim]{ENV_FILE}[/dim]")
+    console.print(f"\n[green]✓[/green] Configuration saved to: [dim]{env_path}[/dim]")
 
     # Test the connection
     console.print("\n[bold]Step 4:[/bold] Testing connection...")
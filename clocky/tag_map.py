@@ -10,30 +10,33 @@ projects we want a deterministic 1:1 mapping.
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from pydantic_core import from_json, to_json
 
-def _map_path() -> Path:
-    return Path.home() / ".config" / "clocky" / "tag-map.json"
+from clocky.paths import tag_map_file as _map_path
 
 
 @dataclass(frozen=True)
 class TagMap:
-    """Project→Tag mapping persisted on disk."""
+    """Project→Tag mapping persisted on disk.
+
+    Instances are immutable: :meth:`set`, :meth:`update` and :meth:`unset`
+    return a new map flagged ``dirty`` so callers can load once, apply several
+    edits, and write once with :meth:`save_if_dirty`.
+    """
 
     project_to_tag: dict[str, str]
+    dirty: bool = field(default=False, compare=False)
 
     @classmethod
     def load(cls) -> TagMap:
-        """Load mapping from disk."""
-        path = _map_path()
-        if not path.exists():
-            return cls(project_to_tag={})
+        """Load mapping from disk, treating a missing or malformed file as empty."""
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            data = from_json(_map_path().read_bytes())
+        except (OSError, ValueError):
             return cls(project_to_tag={})
         if not isinstance(data, dict):
             return cls(project_to_tag={})
@@ -46,23 +49,46 @@ class TagMap:
 
     def set(self, project_id: str, tag_id: str) -> TagMap:
         """Return a new TagMap with a mapping added."""
+        if self.project_to_tag.get(project_id) == tag_id:
+            return self
         updated = dict(self.project_to_tag)
         updated[project_id] = tag_id
-        return TagMap(project_to_tag=updated)
+        return TagMap(project_to_tag=updated, dirty=True)
+
+    def update(self, mapping: dict[str, str]) -> TagMap:
+        """Return a new TagMap with every mapping in *mapping* added at once."""
+        if all(self.project_to_tag.get(k) == v for k, v in mapping.items()):
+            return self
+        return TagMap(project_to_tag={**self.project_to_tag, **mapping}, dirty=True)
+
+    def unset(self, project_id: str) -> TagMap:
+        """Return a new TagMap without the mapping for ``project_id``."""
+        if project_id not in self.project_to_tag:
+            return self
+        updated = {k: v for k, v in self.project_to_tag.items() if k != project_id}
+        return TagMap(project_to_tag=updated, dirty=True)
+
+    def save_if_dirty(self) -> None:
+        """Persist mapping to disk only if it was changed since loading."""
+        if self.dirty:
+            self.save()
 
     def save(self) -> None:
-        """Persist mapping to disk."""
+        """Persist mapping to disk.
+
+        The file is written next to the target and renamed over it, so a crash
+        mid-write never leaves a truncated map behind.
+        """
         path = _map_path()
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(self.project_to_tag, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_bytes(to_json(dict(sorted(self.project_to_tag.items())), indent=2) + b"\n")
         try:
-            path.chmod(0o600)
+            tmp.chmod(0o600)
         except PermissionError:
             # Best-effort on systems that do not support chmod.
             pass
+        os.replace(tmp, path)
 
 
 def tag_map_path() -> Path:
@@ -147,19 +147,32 @@ class MockClockifyAPI(ClockifyAPI):
         """Return mock workspaces."""
         return MOCK_WORKSPACES
 
-    def get_projects(self, workspace_id: str) -> list[Project]:
-        """Return mock projects."""
-        del workspace_id  # unused
+    def get_projects(
+        self,
+        workspace_id: str,
+        *,
+        fresh: bool = False,
+        client_ids: list[str] | None = None,
+    ) -> list[Project]:
+        """Return mock projects, optionally only those of the given clients."""
+        del workspace_id, fresh  # unused
+        if client_ids:
+            return [p for p in MOCK_PROJECTS if p.client_id in client_ids]
         return MOCK_PROJECTS
 
+    def get_project(self, workspace_id: str, project_id: str) -> Project | None:
+        """Return the mock project with this ID, if any."""
+        del workspace_id  # unused
+        return next((p for p in MOCK_PROJECTS if p.id == project_id), None)
+
     def get_clients(self, workspace_id: str) -> list[Client]:
         """Return mock clients."""
         del workspace_id  # unused
         return MOCK_CLIENTS
 
-    def get_tags(self, workspace_id: str) -> list[Tag]:
+    def get_tags(self, workspace_id: str, *, fresh: bool = False) -> list[Tag]:
         """Return mock tags."""
-        del workspace_id  # unused
+        del workspace_id, fresh  # unused
         return MOCK_TAGS
 
     def get_time_entries(
@@ -167,9 +180,12 @@ class MockClockifyAPI(ClockifyAPI):
         workspace_id: str,
         user_id: str,
         limit: int = 10,
+        project_id: str | None = None,
     ) -> list[TimeEntry]:
-        """Return mock time entries."""
+        """Return mock time entries, filtered by project like the real endpoint."""
         del workspace_id, user_id  # unused
+        if project_id is not None:
+            return [e for e in MOCK_TIME_ENTRIES if e.project_id == project_id][:limit]
         return MOCK_TIME_ENTRIES[:limit]
 
     def get_running_timer(self, workspace_id: str, user_id: str) -> TimeEntry | None:
@@ -204,7 +220,7 @@ class MockClockifyAPI(ClockifyAPI):
         del workspace_id, user_id  # unused
         if self._running_timer is None:
             raise ValueError("No timer is currently running.")
-        end_dt = datetime.fromisoformat(request.end.replace("Z", "+00:00"))
+        end_dt = datetime.fromisoformat(request.end)  # accepts a trailing "Z" on 3.11+
         stopped = self._running_timer.model_copy(
             update={
                 "time_interval": self._running_timer.time_interval.model_copy(
@@ -0,0 +1,69 @@
+"""Shared pytest fixtures.
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import clocky.cli as cli
+import clocky.cli_tag_map as cli_tag_map
+from clocky.context import AppContext
+from clocky.testing import MOCK_TIME_ENTRIES, MockClockifyAPI
+
+
+@pytest.fixture(autouse=True)
+def _no_daemon(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep tests from talking to a real ``clocky daemon`` on this machine."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared CLI runner; it holds only configuration, so one per session is safe."""
+    return CliRunner()
+
+
+def _install(monkeypatch: pytest.MonkeyPatch, ctx: AppContext) -> AppContext:
+    """Make *ctx* the context every CLI command builds for this test."""
+    monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    monkeypatch.setattr(cli_tag_map, "build_context", lambda: ctx)
+    return ctx
+
+
+@pytest.fixture
+def ctx(monkeypatch: pytest.MonkeyPatch, home: Path) -> AppContext:
+    """Offline context backed by ``MockClockifyAPI``, installed for the CLI.
+
+    Depends on :func:`home`, so commands that save the tag map or cache never
+    write to the developer's real home directory.
+    """
+    api = MockClockifyAPI()
+    user = api.get_user()
+    return _install(
+        monkeypatch, AppContext(api=api, user=user, workspace_id=user.default_workspace)
+    )
+
+
+@pytest.fixture
+def ctx_with_timer(monkeypatch: pytest.MonkeyPatch, home: Path) -> AppContext:
+    """Like :func:`ctx`, but with a timer already running."""
+    api = MockClockifyAPI(running_timer=MOCK_TIME_ENTRIES[0])
+    user = api.get_user()
+    return _install(
+        monkeypatch, AppContext(api=api, user=user, workspace_id=user.default_workspace)
+    )
+
+
+@pytest.fixture
+def home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point ``Path.home()`` and ``$HOME`` at an empty per-test directory."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(Path, "home", staticmethod(lambda: home))
+    return home
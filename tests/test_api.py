@@ -0,0 +1,160 @@
+"""Tests for ClockifyAPI response parsing (HTTP mocked with pytest-httpx).
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from clocky.api import BASE_URL, ClockifyAPI
+from clocky.models import StartTimerRequest, StopTimerRequest
+
+_ENTRY = {
+    "id": "e1",
+    "description": "Work",
+    "projectId": "p1",
+    "workspaceId": "ws1",
+    "userId": "u1",
+    "tagIds": ["t1"],
+    "timeInterval": {"start": "2024-01-01T09:00:00Z", "end": None, "duration": None},
+}
+
+
+@pytest.fixture
+def api() -> ClockifyAPI:
+    return ClockifyAPI(api_key="test-key")
+
+
+def test_get_user(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/user",
+        json={"id": "u1", "name": "Alice", "email": "a@example.com", "defaultWorkspace": "ws1"},
+    )
+    user = api.get_user()
+    assert user.default_workspace == "ws1"
+    assert httpx_mock.get_request().headers["X-Api-Key"] == "test-key"
+
+
+def test_get_projects_validates_list(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=[
+            {"id": "p1", "name": "Alpha", "clientId": "c1", "clientName": "ACME"},
+            {"id": "p2", "name": "Beta"},
+        ]
+    )
+    projects = api.get_projects("ws1")
+    assert [p.name for p in projects] == ["Alpha", "Beta"]
+    assert projects[0].client_name == "ACME"
+    assert httpx_mock.get_request().url.params["page-size"] == "500"
+
+
+def test_get_running_timer_none(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json=[])
+    assert api.get_running_timer("ws1", "u1") is None
+
+
+def test_get_running_timer_active(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json=[_ENTRY])
+    entry = api.get_running_timer("ws1", "u1")
+    assert entry is not None
+    assert entry.time_interval.end is None
+
+
+def test_start_and_stop_timer(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(method="POST", json=_ENTRY)
+    httpx_mock.add_response(
+        method="PATCH",
+        json={**_ENTRY, "timeInterval": {**_ENTRY["timeInterval"], "end": "2024-01-01T10:00:00Z"}},
+    )
+    started = api.start_timer("ws1", StartTimerRequest(start="2024-01-01T09:00:00Z"))
+    stopped = api.stop_timer("ws1", "u1", StopTimerRequest(end="2024-01-01T10:00:00Z"))
+    assert started.id == stopped.id == "e1"
+    assert stopped.time_interval.end is not None
+
+
+def test_http_error_raises(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=401)
+    with pytest.raises(httpx.HTTPStatusError):
+        api.get_tags("ws1")
+
+
+def test_cached_tags_skip_network(httpx_mock: HTTPXMock, home: Path) -> None:
+    httpx_mock.add_response(json=[{"id": "t1", "name": "billable", "workspaceId": "ws1"}])
+    api = ClockifyAPI(api_key="test-key", cache_ttl=60)
+
+    first = api.get_tags("ws1")
+    second = api.get_tags("ws1")
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_time_entries_project_filter(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json=[_ENTRY])
+    entries = api.get_time_entries("ws1", "u1", limit=50, project_id="p1")
+    params = httpx_mock.get_request().url.params
+    assert params["project"] == "p1"
+    assert params["page-size"] == "50"
+    assert entries[0].project_id == "p1"
+
+
+def test_stale_cache_revalidated_with_etag(httpx_mock: HTTPXMock, home: Path) -> None:
+    body = [{"id": "t1", "name": "billable", "workspaceId": "ws1"}]
+    httpx_mock.add_response(json=body, headers={"ETag": '"v1"'})
+    httpx_mock.add_response(status_code=304, match_headers={"If-None-Match": '"v1"'})
+
+    ClockifyAPI(api_key="test-key", cache_ttl=60).get_tags("ws1")
+    # A tiny TTL makes the entry stale, forcing a conditional request.
+    tags = ClockifyAPI(api_key="test-key", cache_ttl=1e-9).get_tags("ws1")
+
+    assert [t.name for t in tags] == ["billable"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_project(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/workspaces/ws1/projects/p1",
+        json={"id": "p1", "name": "Alpha", "clientId": "c1", "clientName": "ACME"},
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/workspaces/ws1/projects/gone", status_code=404)
+    project = api.get_project("ws1", "p1")
+    assert project is not None
+    assert project.name == "Alpha"
+    assert api.get_project("ws1", "gone") is None
+
+
+def test_fresh_projects_bypass_cache(httpx_mock: HTTPXMock, home: Path) -> None:
+    httpx_mock.add_response(json=[{"id": "p1", "name": "Alpha"}])
+    httpx_mock.add_response(json=[{"id": "p1", "name": "Alpha"}, {"id": "p2", "name": "Beta"}])
+    api = ClockifyAPI(api_key="test-key", cache_ttl=600)
+
+    assert len(api.get_projects("ws1")) == 1
+    assert len(api.get_projects("ws1")) == 1  # served from cache
+    assert len(api.get_projects("ws1", fresh=True)) == 2
+    assert len(api.get_projects("ws1")) == 2  # refreshed copy cached
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_projects_client_filter(api: ClockifyAPI, httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(json=[{"id": "p1", "name": "Alpha", "clientId": "c1"}])
+    projects = api.get_projects("ws1", client_ids=["c1"])
+    params = httpx_mock.get_request().url.params
+    assert params["clients"] == "c1"
+    assert params["page-size"] == "500"
+    assert [p.id for p in projects] == ["p1"]
+
+
+def test_cache_scoped_to_api_key(httpx_mock: HTTPXMock, home: Path) -> None:
+    httpx_mock.add_response(json=[{"id": "t1", "name": "mine", "workspaceId": "ws1"}])
+    httpx_mock.add_response(json=[{"id": "t2", "name": "theirs", "workspaceId": "ws1"}])
+
+    ClockifyAPI(api_key="key-a", cache_ttl=600).get_tags("ws1")
+    tags = ClockifyAPI(api_key="key-b", cache_ttl=600).get_tags("ws1")
+
+    assert [t.name for t in tags] == ["theirs"]
+    assert len(httpx_mock.get_requests()) == 2
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-
 import pytest
 
 from clocky.models import StartTimerRequest, StopTimerRequest
@@ -15,6 +13,15 @@ from clocky.testing import (
     MockClockifyAPI,
 )
 
+# Fixed timestamp, after MOCK_TIME_ENTRIES[0] starts: the values are never inspected.
+NOW_ISO = "2024-01-15T12:00:00Z"
+
+# Requests are read-only inputs to the mock, so one instance of each is shared.
+START_REQ = StartTimerRequest(start=NOW_ISO, description="Test", project_id="proj-001")
+START_BARE_REQ = StartTimerRequest(start=NOW_ISO)
+START_TAGGED_REQ = StartTimerRequest(start=NOW_ISO, tag_ids=["tag-001", "tag-002"])
+STOP_REQ = StopTimerRequest(end=NOW_ISO)
+
 
 @pytest.fixture
 def api() -> MockClockifyAPI:
@@ -61,6 +68,10 @@ class TestGetters:
         entries = api.get_time_entries("ws-001", "user-001", limit=1)
         assert len(entries) == 1
 
+    def test_get_time_entries_project_filter(self, api: MockClockifyAPI) -> None:
+        entries = api.get_time_entries("ws-001", "user-001", project_id="proj-002")
+        assert [e.id for e in entries] == ["entry-002"]
+
     def test_running_timer_none(self, api: MockClockifyAPI) -> None:
         assert api.get_running_timer("ws-001", "user-001") is None
 
@@ -74,22 +85,17 @@ class TestStartTimer:
     """Tests for start_timer."""
 
     def test_start_sets_running(self, api: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        req = StartTimerRequest(start=now, description="Test", project_id="proj-001")
-        entry = api.start_timer("ws-001", req)
+        entry = api.start_timer("ws-001", START_REQ)
         assert entry.id == "entry-new"
         assert entry.description == "Test"
         assert entry.project_id == "proj-001"
 
     def test_start_no_project(self, api: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        entry = api.start_timer("ws-001", StartTimerRequest(start=now))
+        entry = api.start_timer("ws-001", START_BARE_REQ)
         assert entry.project_id is None
 
     def test_start_with_tags(self, api: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        req = StartTimerRequest(start=now, tag_ids=["tag-001", "tag-002"])
-        entry = api.start_timer("ws-001", req)
+        entry = api.start_timer("ws-001", START_TAGGED_REQ)
         assert "tag-001" in entry.tag_ids
 
 
@@ -97,16 +103,13 @@ class TestStopTimer:
     """Tests for stop_timer."""
 
     def test_stop_clears_running(self, api_with_timer: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        api_with_timer.stop_timer("ws-001", "user-001", StopTimerRequest(end=now))
+        api_with_timer.stop_timer("ws-001", "user-001", STOP_REQ)
         assert api_with_timer.get_running_timer("ws-001", "user-001") is None
 
     def test_stop_no_running_raises(self, api: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
         with pytest.raises(ValueError, match="No timer"):
-            api.stop_timer("ws-001", "user-001", StopTimerRequest(end=now))
+            api.stop_timer("ws-001", "user-001", STOP_REQ)
 
     def test_stop_returns_with_end(self, api_with_timer: MockClockifyAPI) -> None:
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        stopped = api_with_timer.stop_timer("ws-001", "user-001", StopTimerRequest(end=now))
+        stopped = api_with_timer.stop_timer("ws-001", "user-001", STOP_REQ)
         assert stopped.time_interval.end is not None
@@ -0,0 +1,49 @@
+"""Tests for the on-disk response cache.
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from clocky.cache import read_cached, read_stale, touch_cached, write_cached
+from clocky.paths import cache_dir
+
+pytestmark = pytest.mark.usefixtures("home")
+
+
+def test_miss_when_absent() -> None:
+    assert read_cached("projects-ws.json", ttl=60) is None
+
+
+def test_roundtrip() -> None:
+    write_cached("projects-ws.json", b"[]")
+    assert read_cached("projects-ws.json", ttl=60) == b"[]"
+    assert (cache_dir() / "projects-ws.json").stat().st_mode & 0o777 == 0o600
+
+
+def test_stale_entry_ignored() -> None:
+    write_cached("tags-ws.json", b"[]")
+    old = time.time() - 120
+    os.utime(cache_dir() / "tags-ws.json", (old, old))
+    assert read_cached("tags-ws.json", ttl=60) is None
+
+
+def test_etag_sidecar() -> None:
+    write_cached("projects-ws.json", b"[1]", etag='"abc"')
+    assert read_stale("projects-ws.json") == ('"abc"', b"[1]")
+
+    write_cached("projects-ws.json", b"[2]")
+    assert read_stale("projects-ws.json") is None
+
+
+def test_touch_refreshes_stale_entry() -> None:
+    write_cached("tags-ws.json", b"[]")
+    old = time.time() - 120
+    os.utime(cache_dir() / "tags-ws.json", (old, old))
+    touch_cached("tags-ws.json")
+    assert read_cached("tags-ws.json", ttl=60) == b"[]"
@@ -10,8 +10,7 @@ from typer.testing import CliRunner
 import clocky.cli as cli
 
 
-def test_help_works() -> None:
-    runner = CliRunner()
+def test_help_works(runner: CliRunner) -> None:
     result = runner.invoke(cli.app, ["--help"])
     assert result.exit_code == 0
     assert "start" in result.output
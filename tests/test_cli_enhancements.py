@@ -6,105 +6,82 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import json
+import re
+import subprocess
+import sys
 
 import pytest
 from typer.testing import CliRunner
 
 import clocky.cli as cli
 from clocky.context import AppContext
-from clocky.testing import MOCK_TIME_ENTRIES, MockClockifyAPI
-
-
-@pytest.fixture
-def runner() -> CliRunner:
-    return CliRunner()
-
-
-@pytest.fixture
-def ctx() -> AppContext:
-    api = MockClockifyAPI()
-    user = api.get_user()
-    return AppContext(api=api, user=user, workspace_id=user.default_workspace)
-
-
-@pytest.fixture
-def ctx_with_timer() -> AppContext:
-    api = MockClockifyAPI(running_timer=MOCK_TIME_ENTRIES[0])
-    user = api.get_user()
-    return AppContext(api=api, user=user, workspace_id=user.default_workspace)
+from clocky.testing import MOCK_PROJECTS, MockClockifyAPI
 
 
 class TestJsonOutput:
-    def test_status_json_no_timer(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_status_json_no_timer(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "status"])
         assert result.exit_code == 0
         assert json.loads(result.output) is None
 
-    def test_status_json_with_timer(
-        self, runner: CliRunner, ctx_with_timer: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx_with_timer)
+    def test_status_json_with_timer(self, runner: CliRunner, ctx_with_timer: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "status"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["id"] == "entry-001"
         assert data["project_name"] == "Website Redesign"
 
-    def test_list_json(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_list_json(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "list"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert isinstance(data, list)
         assert len(data) == 2
 
-    def test_projects_json_no_client(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_projects_json_no_client(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "projects"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert isinstance(data, list)
         assert len(data) == 5
 
-    def test_start_json(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_start_json(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "start", "Website", "--non-interactive"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["id"] == "entry-new"
 
-    def test_stop_json_no_timer(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_stop_json_no_timer(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "stop"])
         assert result.exit_code == 0
         assert json.loads(result.output) is None
 
-    def test_delete_json(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_delete_json(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--json", "delete", "entry-001", "--force"])
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["deleted"] == "entry-001"
 
+    def test_emit_json_matches_stdlib_layout(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from clocky.output import emit_json
+
+        data = {"name": "Café", "tags": ["a", "b"], "end": None, "n": 1.5}
+        emit_json(data)
+        assert capsys.readouterr().out == json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+    def test_emit_json_text_only_stream(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import io
+
+        from clocky.output import emit_json
+
+        out = io.StringIO()  # no .buffer, e.g. a redirected text stream
+        monkeypatch.setattr("sys.stdout", out)
+        emit_json({"a": 1})
+        assert out.getvalue() == '{\n  "a": 1\n}\n'
+
 
 class TestQuietOutput:
-    def test_quiet_start_minimal(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_quiet_start_minimal(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["--quiet", "start", "Website", "--non-interactive"])
         assert result.exit_code == 0
         # Should still have success message but no tag/project info lines
@@ -113,20 +90,14 @@ class TestQuietOutput:
 
 
 class TestDryRun:
-    def test_dry_run_does_not_start(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_dry_run_does_not_start(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["start", "Website", "--non-interactive", "--dry-run"])
         assert result.exit_code == 0
         assert "Dry run" in result.output
         # No timer should be running
         assert ctx.api.get_running_timer("ws-001", "user-001") is None
 
-    def test_dry_run_json(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_dry_run_json(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(
             cli.app, ["--json", "start", "Website", "--non-interactive", "--dry-run"]
         )
@@ -137,10 +108,7 @@ class TestDryRun:
 
 
 class TestDeleteCommand:
-    def test_delete_with_force(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_delete_with_force(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["delete", "entry-001", "--force"])
         assert result.exit_code == 0
         assert "Deleted" in result.output
@@ -151,28 +119,19 @@ class TestDeleteCommand:
 
 
 class TestProjectsOptionalClient:
-    def test_projects_all(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_projects_all(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["projects"])
         assert result.exit_code == 0
         assert "Projects" in result.output
 
-    def test_projects_with_client(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_projects_with_client(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["projects", "Acme"])
         assert result.exit_code == 0
         assert "Projects" in result.output
 
 
 class TestExitCodes:
-    def test_no_match_returns_2(
-        self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    def test_no_match_returns_2(self, runner: CliRunner, ctx: AppContext) -> None:
         result = runner.invoke(cli.app, ["start", "zzzznonexistent", "--non-interactive"])
         assert result.exit_code == 2
 
@@ -181,9 +140,37 @@ class TestNoColor:
     def test_no_color_env(
         self, runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        monkeypatch.setattr(cli, "build_context", lambda: ctx)
         monkeypatch.setenv("NO_COLOR", "1")
         result = runner.invoke(cli.app, ["status"])
         assert result.exit_code == 0
         # Should not contain ANSI escape codes
         assert "\x1b[" not in result.output
+
+
+def test_now_utc_format() -> None:
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", cli._now_utc())
+
+
+def test_infer_tag_for_project_most_common() -> None:
+    api = MockClockifyAPI()
+    assert cli._infer_tag_for_project(api, "ws-001", "user-001", "proj-002") == "tag-002"
+    assert cli._infer_tag_for_project(api, "ws-001", "user-001", "proj-004") is None
+
+
+def test_pick_one_non_interactive_skips_questionary() -> None:
+    # Fresh interpreter: the test session itself may already have imported it.
+    code = (
+        "import sys\n"
+        "import clocky.cli as cli\n"
+        "from clocky.testing import MOCK_PROJECTS\n"
+        "matches = [(p, 90.0) for p in MOCK_PROJECTS[:2]]\n"
+        "assert cli._pick_one(matches, 'name', non_interactive=True) is MOCK_PROJECTS[0]\n"
+        "assert 'questionary' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_pick_one_without_tty_returns_best(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "_STDIN_IS_TTY", False)
+    matches = [(p, 90.0) for p in MOCK_PROJECTS[:2]]
+    assert cli._pick_one(matches, "name") is MOCK_PROJECTS[0]
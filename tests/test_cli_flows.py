@@ -8,58 +8,96 @@ using the MockClockifyAPI.
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from typer.testing import CliRunner
 
 import clocky.cli as cli
 from clocky.context import AppContext
-from clocky.testing import MockClockifyAPI
+from clocky.models import Project, Tag
+from clocky.testing import MOCK_PROJECTS, MOCK_TAGS, MOCK_TIME_ENTRIES
 
 
-@pytest.fixture
-def runner() -> CliRunner:
-    return CliRunner()
+def test_status_no_timer(runner: CliRunner, ctx: AppContext) -> None:
+    result = runner.invoke(cli.app, ["status"])
+    assert result.exit_code == 0
+    assert "No timer" in result.output
 
 
-@pytest.fixture
-def ctx() -> AppContext:
-    api = MockClockifyAPI()
-    user = api.get_user()
-    return AppContext(api=api, user=user, workspace_id=user.default_workspace)
+def test_status_shows_start_time(runner: CliRunner, ctx_with_timer: AppContext) -> None:
+    result = runner.invoke(cli.app, ["status"])
+    assert result.exit_code == 0
+    assert "Started:     2024-01-15 09:00:00 UTC" in result.output
 
 
-def test_status_no_timer(
-    runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
+def test_status_project_name_from_cached_projects(
+    ctx_with_timer: AppContext, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
-    result = runner.invoke(cli.app, ["status"])
-    assert result.exit_code == 0
-    assert "No timer" in result.output
+    def fail(*_args: object) -> None:
+        raise AssertionError("get_project should not be called")
 
+    monkeypatch.setattr(ctx_with_timer.api, "get_project", fail)
+    _, project_name, _ = cli._resolve_status(ctx_with_timer, with_tags=False)
+    assert project_name == "Website Redesign"
 
-def test_start_non_interactive_sets_project(
-    runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
+
+def test_status_project_name_falls_back_for_unknown_id(
+    ctx_with_timer: AppContext, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
+    archived = Project(id="proj-old", name="Old Project")
+    timer = MOCK_TIME_ENTRIES[0].model_copy(update={"project_id": archived.id})
+    monkeypatch.setattr(ctx_with_timer.api, "get_running_timer", lambda *_: timer)
+    monkeypatch.setattr(ctx_with_timer.api, "get_project", lambda *_: archived)
+    _, project_name, _ = cli._resolve_status(ctx_with_timer, with_tags=False)
+    assert project_name == "Old Project"
+
+
+def test_start_non_interactive_sets_project(runner: CliRunner, ctx: AppContext) -> None:
     result = runner.invoke(cli.app, ["start", "Project Alpha", "--non-interactive"])
     assert result.exit_code == 0
     assert "Timer started" in result.output
 
 
-def test_stop_no_timer_is_noop(
+def test_start_revalidates_projects_without_exact_match(
     runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
-    result = runner.invoke(cli.app, ["stop"])
+    created = Project(id="proj-new", name="Website Redesign 2")
+
+    def get_projects(_ws: str, *, fresh: bool = False, **_kw: object) -> list[Project]:
+        return [*MOCK_PROJECTS, created] if fresh else MOCK_PROJECTS
+
+    monkeypatch.setattr(ctx.api, "get_projects", get_projects)
+    args = ["--json", "start", "Website Redesign 2", "--non-interactive", "--dry-run"]
+    result = runner.invoke(cli.app, [*args, "--tag", "billable"])
     assert result.exit_code == 0
-    assert "No timer" in result.output
+    assert json.loads(result.output)["project_id"] == "proj-new"
 
 
-def test_list_shows_table(
+def test_start_revalidates_tags_without_exact_match(
     runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
 ) -> None:
+    created = Tag.model_validate({"id": "tag-new", "name": "billable 2", "workspaceId": "ws-001"})
+
+    def get_tags(_ws: str, *, fresh: bool = False) -> list[Tag]:
+        return [*MOCK_TAGS, created] if fresh else MOCK_TAGS
+
+    monkeypatch.setattr(ctx.api, "get_tags", get_tags)
+    args = ["--json", "start", "Website Redesign", "--non-interactive", "--dry-run"]
+    result = runner.invoke(cli.app, [*args, "--tag", "billable 2"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert (data["tag_ids"], data["tag_names"]) == (["tag-new"], ["billable 2"])
+
+
+def test_stop_no_timer_is_noop(runner: CliRunner, ctx: AppContext) -> None:
+    result = runner.invoke(cli.app, ["stop"])
+    assert result.exit_code == 0
+    assert "No timer" in result.output
+
+
+def test_list_shows_table(runner: CliRunner, ctx: AppContext) -> None:
     # Add a timer entry
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
     _ = runner.invoke(cli.app, ["start", "Project Alpha", "--non-interactive"])
     _ = runner.invoke(cli.app, ["stop"])
 
@@ -68,19 +106,13 @@ def test_list_shows_table(
     assert "Recent Time Entries" in result.output
 
 
-def test_projects_without_client_lists_all(
-    runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
+def test_projects_without_client_lists_all(runner: CliRunner, ctx: AppContext) -> None:
     result = runner.invoke(cli.app, ["projects"])
     assert result.exit_code == 0
     assert "Projects" in result.output
 
 
-def test_projects_for_client_filters(
-    runner: CliRunner, ctx: AppContext, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
+def test_projects_for_client_filters(runner: CliRunner, ctx: AppContext) -> None:
     result = runner.invoke(cli.app, ["projects", "Acme", "--search", "Mobile"])
     assert result.exit_code == 0
     assert "Projects" in result.output
@@ -5,13 +5,42 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import pytest
 from typer.testing import CliRunner
 
 import clocky.cli as cli
+from clocky.tag_map import TagMap
 
 
-def test_tag_map_help_available() -> None:
-    runner = CliRunner()
+def test_tag_map_help_available(runner: CliRunner) -> None:
     result = runner.invoke(cli.app, ["tag-map", "--help"])
     assert result.exit_code == 0
     assert "Manage the persisted project" in result.output
+
+
+@pytest.mark.usefixtures("ctx")
+def test_tag_map_set_resolves_names(runner: CliRunner) -> None:
+    result = runner.invoke(cli.app, ["tag-map", "set", "proj-001", "tag-002"])
+
+    assert result.exit_code == 0
+    assert "Website Redesign → meeting" in result.output
+    assert TagMap.load().get("proj-001") == "tag-002"
+
+
+@pytest.mark.usefixtures("ctx")
+def test_tag_map_set_unknown_tag_falls_back_to_id(runner: CliRunner) -> None:
+    result = runner.invoke(cli.app, ["tag-map", "set", "proj-001", "tag-999"])
+
+    assert result.exit_code == 0
+    assert "tag-999" in result.output
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_edit_coerces_values(runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    click = pytest.importorskip("click")
+    monkeypatch.setattr(click, "edit", lambda _text: '{"proj-001": 7}')
+
+    result = runner.invoke(cli.app, ["tag-map", "edit"])
+
+    assert result.exit_code == 0
+    assert TagMap.load().project_to_tag == {"proj-001": "7"}
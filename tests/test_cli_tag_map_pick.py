@@ -3,43 +3,23 @@
 
 SPDX-License-Identifier: MIT
 
-We patch questionary and build_context so the command runs fully offline.
+We patch questionary and use the offline ``ctx`` fixture so the command runs fully offline.
 """
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
+import questionary
 from typer.testing import CliRunner
 
 import clocky.cli as cli
 import clocky.cli_tag_map as cli_tag_map
-from clocky.context import AppContext
 from clocky.tag_map import TagMap
-from clocky.testing import MOCK_PROJECTS, MOCK_TAGS, MockClockifyAPI
-
-
-@pytest.fixture
-def runner() -> CliRunner:
-    return CliRunner()
-
-
-def test_tag_map_pick_persists(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: CliRunner
-) -> None:
-    # Isolate home so the mapping file goes to a temporary directory.
-    home = tmp_path / "home"
-    home.mkdir()
-    monkeypatch.setattr(Path, "home", staticmethod(lambda: home))
+from clocky.testing import MOCK_PROJECTS, MOCK_TAGS
 
-    # Build an offline context using MockClockifyAPI.
-    api = MockClockifyAPI()
-    user = api.get_user()
-    ctx = AppContext(api=api, user=user, workspace_id=user.default_workspace)
-    monkeypatch.setattr(cli, "build_context", lambda: ctx)
-    monkeypatch.setattr(cli_tag_map, "build_context", lambda: ctx)
 
+@pytest.mark.usefixtures("ctx")
+def test_tag_map_pick_persists(monkeypatch: pytest.MonkeyPatch, runner: CliRunner) -> None:
     # Stateful prompt: first call → project query, second → tag query.
     prompts = iter(["Website", "bill"])
     monkeypatch.setattr(cli_tag_map.typer, "prompt", lambda *_a, **_k: next(prompts))
@@ -58,7 +38,7 @@ def test_tag_map_pick_persists(
         select_calls[0] += 1
         return _Sel(MOCK_PROJECTS[0] if select_calls[0] == 1 else MOCK_TAGS[0])
 
-    monkeypatch.setattr(cli_tag_map.questionary, "select", _mock_select)
+    monkeypatch.setattr(questionary, "select", _mock_select)
 
     result = runner.invoke(cli.app, ["tag-map", "pick"])
     assert result.exit_code == 0
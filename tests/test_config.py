@@ -14,15 +14,18 @@ from clocky.config import (
     Settings,
     _find_env_file,
     _open_browser,
+    _parse_env,
     load_settings,
 )
 
 
 @pytest.fixture
 def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Clear CLOCKIFY_* env vars to prevent leakage."""
+    """Clear CLOCKIFY_* env vars and memoised settings to prevent leakage."""
     monkeypatch.delenv("CLOCKIFY_API_KEY", raising=False)
     monkeypatch.delenv("CLOCKIFY_WORKSPACE_ID", raising=False)
+    monkeypatch.delenv("CLOCKY_ENV_FILE", raising=False)
+    load_settings.cache_clear()
 
 
 @pytest.mark.usefixtures("clean_env")
@@ -62,47 +65,42 @@ class TestSettings:
 class TestFindEnvFile:
     """Tests for _find_env_file()."""
 
-    def test_finds_in_cwd(self, tmp_path: Path) -> None:
+    def test_finds_in_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=test\n")
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            assert _find_env_file() == tmp_path / ".env"
-        finally:
-            os.chdir(original)
+        monkeypatch.chdir(tmp_path)
+        assert _find_env_file() == tmp_path / ".env"
 
-    def test_returns_xdg_default_when_missing(
+    def test_env_override_skips_search(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        # Remove global config to test default behavior
-        xdg_env = Path.home() / ".config" / "clocky" / ".env"
-        home_env = Path.home() / ".clocky.env"
-
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            # Temporarily rename existing configs if they exist
-            xdg_backup = None
-            home_backup = None
-            if xdg_env.exists():
-                xdg_backup = xdg_env.with_suffix(".bak")
-                xdg_env.rename(xdg_backup)
-            if home_env.exists():
-                home_backup = home_env.with_suffix(".bak")
-                home_env.rename(home_backup)
-
-            try:
-                found = _find_env_file()
-                # Should return XDG config location as default
-                assert found == xdg_env
-            finally:
-                # Restore backups
-                if xdg_backup and xdg_backup.exists():
-                    xdg_backup.rename(xdg_env)
-                if home_backup and home_backup.exists():
-                    home_backup.rename(home_env)
-        finally:
-            os.chdir(original)
+        monkeypatch.setenv("CLOCKY_ENV_FILE", str(tmp_path / "custom.env"))
+        with patch("os.path.isfile") as isfile:
+            assert _find_env_file() == tmp_path / "custom.env"
+        isfile.assert_not_called()
+
+    def test_env_override_expands_home(self, home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CLOCKY_ENV_FILE", "~/clocky.env")
+        assert _find_env_file() == home / "clocky.env"
+
+    def test_skips_env_directory(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=test\n")
+        (tmp_path / "sub" / ".env").mkdir(parents=True)  # e.g. a virtualenv
+        monkeypatch.chdir(tmp_path / "sub")
+        assert _find_env_file() == tmp_path / ".env"
+
+    def test_returns_xdg_default_when_missing(
+        self, tmp_path: Path, home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        assert _find_env_file() == home / ".config" / "clocky" / ".env"
+
+
+def test_parse_env(tmp_path: Path) -> None:
+    env = tmp_path / ".env"
+    env.write_text(
+        "# comment\n\nexport A=1\nB = \"two # kept\"\nC='3'  # note\nD=four # note\nE=a=b\nnoise\n"
+    )
+    assert _parse_env(env) == {"A": "1", "B": "two # kept", "C": "3", "D": "four", "E": "a=b"}
 
 
 @pytest.mark.usefixtures("clean_env")
@@ -110,88 +108,92 @@ class TestOpenBrowser:
     """Tests for _open_browser()."""
 
     def test_tries_xdg_open(self) -> None:
-        with patch("subprocess.run") as mock_run:
+        with (
+            patch("clocky.browser._xdg_open", return_value="/usr/bin/xdg-open"),
+            patch("subprocess.Popen") as mock_popen,
+        ):
             _open_browser(CLOCKIFY_API_KEY_URL)
-            mock_run.assert_called_once()
-            assert "xdg-open" in mock_run.call_args[0][0]
+            mock_popen.assert_called_once()
+            assert mock_popen.call_args[0][0] == ["/usr/bin/xdg-open", CLOCKIFY_API_KEY_URL]
+            assert mock_popen.call_args[1]["start_new_session"] is True
 
     def test_fallback_webbrowser(self) -> None:
         with (
-            patch("subprocess.run", side_effect=FileNotFoundError),
+            patch("clocky.browser._xdg_open", return_value=None),
+            patch("subprocess.Popen") as mock_popen,
             patch("webbrowser.open") as mock_wb,
         ):
             _open_browser(CLOCKIFY_API_KEY_URL)
+            mock_popen.assert_not_called()
             mock_wb.assert_called_once_with(CLOCKIFY_API_KEY_URL)
 
+    def test_fallback_when_launch_fails(self) -> None:
+        with (
+            patch("clocky.browser._xdg_open", return_value="/usr/bin/xdg-open"),
+            patch("subprocess.Popen", side_effect=FileNotFoundError),
+            patch("webbrowser.open") as mock_wb,
+        ):
+            _open_browser(CLOCKIFY_API_KEY_URL)
+            mock_wb.assert_called_once_with(CLOCKIFY_API_KEY_URL)
 
-@pytest.mark.usefixtures("clean_env")
+
+@pytest.mark.usefixtures("clean_env", "home")
 class TestLoadSettings:
     """Tests for load_settings()."""
 
-    def test_exits_no_file(self, tmp_path: Path) -> None:
-        # Remove global configs temporarily to test "no file" behavior
-        xdg_env = Path.home() / ".config" / "clocky" / ".env"
-        home_env = Path.home() / ".clocky.env"
-
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            xdg_backup = None
-            home_backup = None
-            if xdg_env.exists():
-                xdg_backup = xdg_env.with_suffix(".bak")
-                xdg_env.rename(xdg_backup)
-            if home_env.exists():
-                home_backup = home_env.with_suffix(".bak")
-                home_env.rename(home_backup)
-
-            try:
-                with (
-                    patch("clocky.config._show_setup_guide"),
-                    pytest.raises(SystemExit) as exc,
-                ):
-                    load_settings()
-                assert exc.value.code == 1
-            finally:
-                if xdg_backup and xdg_backup.exists():
-                    xdg_backup.rename(xdg_env)
-                if home_backup and home_backup.exists():
-                    home_backup.rename(home_env)
-        finally:
-            os.chdir(original)
-
-    def test_exits_placeholder(self, tmp_path: Path) -> None:
+    def test_exits_no_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        with (
+            patch("clocky.config._show_setup_guide"),
+            pytest.raises(SystemExit) as exc,
+        ):
+            load_settings()
+        assert exc.value.code == 1
+
+    def test_exits_placeholder(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=your_api_key_here\n")
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            with (
-                patch("clocky.config._show_setup_guide"),
-                pytest.raises(SystemExit),
-            ):
-                load_settings()
-        finally:
-            os.chdir(original)
-
-    def test_exits_missing_key(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        with (
+            patch("clocky.config._show_setup_guide"),
+            pytest.raises(SystemExit),
+        ):
+            load_settings()
+
+    def test_exits_missing_key(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         (tmp_path / ".env").write_text("CLOCKIFY_WORKSPACE_ID=ws-1\n")
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            with (
-                patch("clocky.config._show_setup_guide"),
-                pytest.raises(SystemExit),
-            ):
-                load_settings()
-        finally:
-            os.chdir(original)
-
-    def test_loads_valid(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        with (
+            patch("clocky.config._show_setup_guide"),
+            pytest.raises(SystemExit),
+        ):
+            load_settings()
+
+    def test_loads_valid(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=valid-key\n")
+        monkeypatch.chdir(tmp_path)
+        settings = load_settings()
+        assert settings.clockify_api_key == "valid-key"
+
+    def test_env_var_beats_file_without_exporting_it(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=file-key\nCLOCKIFY_WORKSPACE_ID=ws-f\n")
+        monkeypatch.setenv("CLOCKIFY_API_KEY", "env-key")
+        monkeypatch.chdir(tmp_path)
+        settings = load_settings()
+        assert settings.clockify_api_key == "env-key"
+        assert settings.clockify_workspace_id == "ws-f"
+        assert "CLOCKIFY_WORKSPACE_ID" not in os.environ
+
+    def test_ignores_unrelated_keys(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=valid-key\nDATABASE_URL=sqlite://\n")
+        monkeypatch.chdir(tmp_path)
+        assert load_settings().clockify_api_key == "valid-key"
+
+    def test_memoised(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         (tmp_path / ".env").write_text("CLOCKIFY_API_KEY=valid-key\n")
-        original = Path.cwd()
-        os.chdir(tmp_path)
-        try:
-            settings = load_settings()
-            assert settings.clockify_api_key == "valid-key"
-        finally:
-            os.chdir(original)
+        monkeypatch.chdir(tmp_path)
+        first = load_settings()
+        with patch("clocky.config._find_env_file") as find:
+            assert load_settings() is first
+        find.assert_not_called()
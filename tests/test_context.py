@@ -0,0 +1,43 @@
+"""Tests for AppContext lazy workspace lookups.
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from clocky.context import AppContext
+from clocky.models import Project
+from clocky.testing import MOCK_PROJECTS, MOCK_TAGS, MockClockifyAPI
+
+
+def test_lookups_fetch_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = MockClockifyAPI()
+    user = api.get_user()
+    ctx = AppContext(api=api, user=user, workspace_id=user.default_workspace)
+    calls: list[str] = []
+
+    def _get_projects(workspace_id: str, *, fresh: bool = False) -> list[Project]:
+        calls.append(workspace_id)
+        return MOCK_PROJECTS
+
+    monkeypatch.setattr(api, "get_projects", _get_projects)
+
+    assert ctx.project_name_by_id[MOCK_PROJECTS[0].id] == MOCK_PROJECTS[0].name
+    assert ctx.projects is MOCK_PROJECTS
+    assert ctx.tag_name_by_id[MOCK_TAGS[0].id] == MOCK_TAGS[0].name
+    assert calls == [user.default_workspace]
+
+
+def test_prefetch_meta_feeds_properties(monkeypatch: pytest.MonkeyPatch) -> None:
+    api = MockClockifyAPI()
+    user = api.get_user()
+    ctx = AppContext(api=api, user=user, workspace_id=user.default_workspace)
+
+    ctx.prefetch_meta()
+    monkeypatch.setattr(api, "get_projects", lambda *_a, **_k: pytest.fail("refetched"))
+    monkeypatch.setattr(api, "get_tags", lambda *_a, **_k: pytest.fail("refetched"))
+
+    assert ctx.projects == MOCK_PROJECTS
+    assert ctx.tags == MOCK_TAGS
@@ -0,0 +1,87 @@
+"""Tests for the optional status daemon and the CLI fallback.
+
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+import clocky.cli as cli
+from clocky import daemon
+from clocky.testing import MOCK_TIME_ENTRIES
+
+
+@pytest.fixture
+def running_daemon(tmp_path: Path) -> Iterator[Path]:
+    def _boom(_req: dict[str, Any]) -> Any:
+        raise ValueError("boom")
+
+    path = daemon.socket_path()
+    server = daemon.make_server({"echo": lambda req: req["value"], "boom": _boom}, path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_request_without_daemon_returns_none() -> None:
+    assert not daemon.socket_path().exists()
+    assert daemon.request("status") is None
+
+
+def test_request_round_trip(running_daemon: Path) -> None:
+    assert running_daemon.stat().st_mode & 0o777 == 0o600
+    assert daemon.request("echo", value=[1, "two"]) == [1, "two"]
+
+
+def test_handler_errors_fall_back(running_daemon: Path) -> None:
+    assert daemon.request("boom") is None
+    assert daemon.request("unknown") is None
+
+
+def test_second_daemon_refused(running_daemon: Path) -> None:
+    with pytest.raises(RuntimeError, match="already running"):
+        daemon.make_server({}, running_daemon)
+
+
+def test_probe_connection_is_ignored(
+    running_daemon: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(running_daemon))
+    assert daemon.request("echo", value=1) == 1
+    assert "Traceback" not in capfd.readouterr().err
+
+
+def test_stale_socket_replaced(tmp_path: Path) -> None:
+    path = daemon.socket_path()
+    path.touch()
+    with daemon.make_server({}, path) as server:
+        assert server.server_address == str(path)
+
+
+def test_status_uses_daemon_reply(runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    reply = {
+        "entry": MOCK_TIME_ENTRIES[0].model_dump(mode="json", by_alias=True),
+        "project_name": "Website Redesign",
+        "tag_names": ["billable"],
+    }
+    monkeypatch.setattr(cli, "daemon_request", lambda *_a, **_k: reply)
+    monkeypatch.setattr(cli, "build_context", lambda: pytest.fail("should not connect"))
+
+    result = runner.invoke(cli.app, ["--json", "status"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["id"] == MOCK_TIME_ENTRIES[0].id
+    assert data["project_name"] == "Website Redesign"
@@ -7,13 +7,22 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-from clocky.display import format_duration
+from clocky.display import _format_minute, _get_duration, format_duration
 from clocky.models import TimeEntry, TimeInterval
 
 
 def test_format_duration() -> None:
     assert format_duration(timedelta(seconds=0)) == "0h 0m 0s"
     assert format_duration(timedelta(seconds=3661)) == "1h 1m 1s"
+    assert format_duration(timedelta(days=3, seconds=61)) == "72h 1m 1s"
+    assert format_duration(timedelta(seconds=59, microseconds=999_999)) == "0h 0m 59s"
+    # Slight clock skew (start just after now) still reads as zero.
+    assert format_duration(timedelta(microseconds=-500_000)) == "0h 0m 0s"
+
+
+def test_format_minute_matches_strftime() -> None:
+    for dt in (datetime(2024, 1, 2, 9, 5, 59, 123, tzinfo=UTC), datetime(2024, 12, 31, 23, 59)):
+        assert _format_minute(dt) == dt.strftime("%Y-%m-%d %H:%M")
 
 
 def test_time_entry_duration_running_uses_duration_string() -> None:
@@ -31,3 +40,34 @@ def test_time_entry_duration_running_uses_duration_string() -> None:
     # Private helper is exercised via print_time_entries in other tests;
     # here we just ensure the model accepts running interval.
     assert entry.time_interval.duration == "PT1H"
+
+
+def test_duration_treats_naive_times_as_utc() -> None:
+    interval = TimeInterval(start="2024-01-01T09:00:00", end="2024-01-01T10:00:00+00:00")
+    entry = TimeEntry(
+        id="e1",
+        workspaceId="ws",  # type: ignore[call-arg]
+        userId="u",
+        timeInterval=interval,
+    )
+    assert _get_duration(entry) == "1h 0m 0s"
+
+
+def test_consoles_shared_and_lazy() -> None:
+    import subprocess
+    import sys
+
+    from clocky.console import console, err_console
+
+    assert console() is console()
+    assert err_console().stderr
+    # Importing the CLI must not build a Console (and probe the terminal) up front.
+    code = (
+        "import rich.console as rc\n"
+        "built = []\n"
+        "init = rc.Console.__init__\n"
+        "rc.Console.__init__ = lambda self, *a, **k: built.append(1) or init(self, *a, **k)\n"
+        "import clocky.cli\n"
+        "assert not built, built\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
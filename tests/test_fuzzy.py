@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from rapidfuzz import fuzz
+
 from clocky.fuzzy import fuzzy_best, fuzzy_search
 from clocky.testing import MOCK_CLIENTS, MOCK_PROJECTS
 
@@ -49,10 +51,65 @@ class TestFuzzySearch:
         # Also assert it's the top match
         assert results[0][0].name == "Data Pipe New"
 
+    def test_case_insensitive(self) -> None:
+        results = fuzzy_search("app", MOCK_PROJECTS, lambda p: p.name)
+        assert results[0][0].name == "Mobile App"
+        assert results[0][1] == 100
+
+    def test_exact_match_short_circuits(self) -> None:
+        results = fuzzy_search("data pipeline", MOCK_PROJECTS, lambda p: p.name)
+        assert [(p.name, score) for p, score in results] == [("Data Pipeline", 100.0)]
+
+    def test_prefix_hits_do_not_hide_better_matches(self) -> None:
+        items = ["Apple Research", "Mobile App", "Web App Backend"]
+        results = fuzzy_search("app", items, lambda n: n)
+        assert [(n, s) for n, s in results] == [("Mobile App", 100.0), ("Web App Backend", 100.0)]
+
+    def test_prefix_hits_break_ties(self) -> None:
+        items = ["Big Data Pipeline", "Data Pipeline", "Data Warehouse"]
+        results = fuzzy_search("data", items, lambda n: n)
+        assert [n for n, _ in results] == ["Data Pipeline", "Data Warehouse", "Big Data Pipeline"]
+        assert {s for _, s in results} == {100.0}
+        assert fuzzy_best("data", items, lambda n: n) == "Data Pipeline"
+
+    def test_prefix_below_cutoff_is_not_returned(self) -> None:
+        assert fuzzy_search("dat", MOCK_PROJECTS, lambda p: p.name) == []
+        assert fuzzy_best("dat", MOCK_PROJECTS, lambda p: p.name) is None
+
+    def test_substring_below_cutoff_is_not_returned(self) -> None:
+        assert fuzzy_search("pp", ["Mobile App"], lambda n: n) == []
+        assert fuzzy_best("pp", ["Mobile App"], lambda n: n) is None
+
+    def test_substring_hits_break_ties_after_prefix_hits(self) -> None:
+        items = ["Warehouse", "Big Data", "Data Lake"]
+
+        def flat(*_args: object, **_kwargs: object) -> float:
+            return 50.0
+
+        results = fuzzy_search("data", items, lambda n: n, scorer=flat)
+        assert [n for n, _ in results] == ["Data Lake", "Big Data", "Warehouse"]
+        assert fuzzy_best("data", items, lambda n: n, scorer=flat) == "Data Lake"
+        assert fuzzy_best("data", items[:2], lambda n: n, scorer=flat) == "Big Data"
+
     def test_limit_respected(self) -> None:
         results = fuzzy_search("a", MOCK_PROJECTS, lambda p: p.name, limit=2)
         assert len(results) <= 2
 
+    def test_precomputed_names_match_key(self) -> None:
+        names = [p.name for p in MOCK_PROJECTS]
+        with_names = fuzzy_search("Data", MOCK_PROJECTS, lambda p: p.name, names=names)
+        with_key = fuzzy_search("Data", MOCK_PROJECTS, lambda p: p.name)
+        assert with_names == with_key
+
+    def test_custom_scorer(self) -> None:
+        # token_set_ratio ignores word order; plain ratio does not.
+        default = fuzzy_search("Pipeline Data", MOCK_PROJECTS, lambda p: p.name)
+        ordered = fuzzy_search("Pipeline Data", MOCK_PROJECTS, lambda p: p.name, scorer=fuzz.ratio)
+        assert default[0][1] == 100.0
+        assert ordered[0][1] < 100.0
+        best = fuzzy_best("Pipeline Data", MOCK_PROJECTS, lambda p: p.name, scorer=fuzz.ratio)
+        assert best is ordered[0][0]
+
     def test_client_search(self) -> None:
         results = fuzzy_search("Acme", MOCK_CLIENTS, lambda c: c.name)
         assert results[0][0].name == "Acme Corp"
@@ -79,3 +136,9 @@ class TestFuzzyBest:
         result = fuzzy_best("Internal Tools", MOCK_PROJECTS, lambda p: p.name)
         assert result is not None
         assert result.name == "Internal Tools"
+
+    def test_agrees_with_fuzzy_search(self) -> None:
+        for query in ("Data", "app", "Webiste", ""):
+            top = fuzzy_search(query, MOCK_PROJECTS, lambda p: p.name, limit=1)
+            best = fuzzy_best(query, MOCK_PROJECTS, lambda p: p.name)
+            assert best is (top[0][0] if top else None)
@@ -15,7 +15,9 @@ from pathlib import Path
 import pytest
 
 from clocky.api import ClockifyAPI
-from clocky.models import StartTimerRequest, StopTimerRequest
+from clocky.cli import _now_utc
+from clocky.config import _parse_env
+from clocky.models import StartTimerRequest, StopTimerRequest, User
 
 # Skip by default — run explicitly with: pytest tests/test_integration.py
 pytestmark = pytest.mark.skipif(
@@ -24,14 +26,12 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api() -> ClockifyAPI:
     """Create a real API client from .env settings.
 
     Reads .env directly to avoid pollution from other tests.
     """
-    from dotenv import dotenv_values
-
     # Use the same resolution as the app: repo .env OR XDG config .env
     env_path = Path(__file__).parent.parent / ".env"
     if not env_path.exists():
@@ -41,7 +41,7 @@ def api() -> ClockifyAPI:
         else:
             pytest.skip(".env file not found")
 
-    values = dotenv_values(env_path)
+    values = _parse_env(env_path)
     api_key = values.get("CLOCKIFY_API_KEY", "")
     if not api_key or api_key == "your_api_key_here":
         pytest.skip("Valid CLOCKIFY_API_KEY not found in .env")
@@ -49,17 +49,22 @@ def api() -> ClockifyAPI:
     return ClockifyAPI(api_key=api_key)
 
 
-@pytest.fixture
-def workspace_id(api: ClockifyAPI) -> str:
+@pytest.fixture(scope="session")
+def user(api: ClockifyAPI) -> User:
+    """Fetch the authenticated user once per run."""
+    return api.get_user()
+
+
+@pytest.fixture(scope="session")
+def workspace_id(user: User) -> str:
     """Get the user's default workspace."""
-    user = api.get_user()
     return user.default_workspace
 
 
 class TestRealAPI:
     """Integration tests against the live Clockify API."""
 
-    def test_start_stop_delete_timer(self, api: ClockifyAPI, workspace_id: str) -> None:
+    def test_start_stop_delete_timer(self, api: ClockifyAPI, user: User, workspace_id: str) -> None:
         """Start a timer on Cross-selling/Dribia with Comercial tag, stop it, delete it.
 
         This test is idempotent — it cleans up after itself.
@@ -78,11 +83,8 @@ class TestRealAPI:
         assert comercial_tag is not None, "Tag 'Comercial' not found"
 
         # Start the timer
-        from datetime import UTC, datetime
-
-        now = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
         start_request = StartTimerRequest(
-            start=now,
+            start=_now_utc(),
             description="[TEST] Integration test entry — will be deleted",
             project_id=cross_selling.id,
             tag_ids=[comercial_tag.id],
@@ -96,14 +98,12 @@ class TestRealAPI:
         time.sleep(1)
 
         # Verify timer is running
-        user = api.get_user()
         running = api.get_running_timer(workspace_id, user.id)
         assert running is not None
         assert running.id == entry.id
 
         # Stop the timer
-        end_time = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-        stop_request = StopTimerRequest(end=end_time)
+        stop_request = StopTimerRequest(end=_now_utc())
         stopped = api.stop_timer(workspace_id, user.id, stop_request)
         assert stopped.time_interval.end is not None
 
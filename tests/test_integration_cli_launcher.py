@@ -24,6 +24,7 @@ It also writes a small launcher-style log file into the repo under logs/.
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -35,6 +36,10 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+# Resolved once: the same PATH lookup that subprocess.run would repeat per call.
+_CLOCKY = shutil.which("clocky")
+
+
 def _repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
@@ -43,20 +48,24 @@ def _log_path() -> Path:
     return _repo_root() / "logs" / "integration-launcher.log"
 
 
-def _log(line: str) -> None:
+@pytest.fixture(scope="module", autouse=True)
+def _trim_log() -> None:
+    """Keep the log bounded, trimming once per run rather than on every line."""
     log_path = _log_path()
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-
     max_bytes = 200_000
     if log_path.exists() and log_path.stat().st_size > max_bytes:
-        data = log_path.read_bytes()[-max_bytes // 2 :]
-        log_path.write_bytes(data)
+        log_path.write_bytes(log_path.read_bytes()[-max_bytes // 2 :])
 
-    log_path.open("a", encoding="utf-8").write(line + "\n")
+
+def _log(line: str) -> None:
+    log_path = _log_path()
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
 
 
 def _run_clocky(*args: str) -> subprocess.CompletedProcess[str]:
-    cmd = ["clocky", *args]
+    cmd = [_CLOCKY or "clocky", *args]
     _log(f"RUN: {' '.join(cmd)}")
     proc = subprocess.run(cmd, text=True, capture_output=True)
     _log(f"exit={proc.returncode}\nstdout={proc.stdout}\nstderr={proc.stderr}")
@@ -65,9 +74,7 @@ def _run_clocky(*args: str) -> subprocess.CompletedProcess[str]:
 
 class TestInstalledClockyCLI:
     def test_start_stop_delete_with_misspelling(self) -> None:
-        # Ensure clocky exists
-        which = subprocess.run(["bash", "-lc", "command -v clocky"], capture_output=True, text=True)
-        assert which.returncode == 0, "clocky executable not found in PATH"
+        assert _CLOCKY is not None, "clocky executable not found in PATH"
 
         # Start timer using misspelled project name
         start = _run_clocky(
@@ -94,12 +101,11 @@ class TestInstalledClockyCLI:
 
         # Delete entry via API directly to keep things clean.
         # Use same .env logic as other integration test.
-        from dotenv import dotenv_values
-
         from clocky.api import ClockifyAPI
+        from clocky.config import _parse_env
 
         env_path = _repo_root() / ".env"
-        values = dotenv_values(env_path) if env_path.exists() else {}
+        values = _parse_env(env_path) if env_path.exists() else {}
         api_key = values.get("CLOCKIFY_API_KEY") or os.getenv("CLOCKIFY_API_KEY")
         if not api_key or api_key == "your_api_key_here":
             pytest.skip("No API key available for cleanup")
@@ -6,27 +6,20 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import json
-from pathlib import Path
 
-from clocky.tag_map import TagMap, tag_map_path
+import pytest
 
+from clocky.tag_map import TagMap, tag_map_path
 
-def test_tag_map_empty_load(monkeypatch: __import__("pytest").MonkeyPatch, tmp_path: Path) -> None:
-    home = tmp_path / "home"
-    home.mkdir()
-    monkeypatch.setattr(Path, "home", staticmethod(lambda: home))
 
+@pytest.mark.usefixtures("home")
+def test_tag_map_empty_load() -> None:
     m = TagMap.load()
     assert m.project_to_tag == {}
 
 
-def test_tag_map_save_and_load(
-    monkeypatch: __import__("pytest").MonkeyPatch, tmp_path: Path
-) -> None:
-    home = tmp_path / "home"
-    home.mkdir()
-    monkeypatch.setattr(Path, "home", staticmethod(lambda: home))
-
+@pytest.mark.usefixtures("home")
+def test_tag_map_save_and_load() -> None:
     m = TagMap(project_to_tag={}).set("p1", "t1").set("p2", "t2")
     m.save()
 
@@ -38,3 +31,64 @@ def test_tag_map_save_and_load(
     loaded = TagMap.load()
     assert loaded.get("p1") == "t1"
     assert loaded.get("missing") is None
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_dirty_tracking() -> None:
+    m = TagMap.load()
+    assert not m.dirty
+    m.save_if_dirty()
+    assert not tag_map_path().exists()
+
+    m = m.set("p1", "t1")
+    assert m.dirty
+    m.save_if_dirty()
+    loaded = TagMap.load()
+    assert loaded.get("p1") == "t1"
+    assert loaded.set("p1", "t1") is loaded  # unchanged value stays clean
+
+    removed = loaded.unset("p1")
+    assert removed.dirty
+    assert removed.get("p1") is None
+    assert loaded.get("p1") == "t1"  # original untouched
+    assert loaded.unset("missing") is loaded
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_update() -> None:
+    m = TagMap(project_to_tag={"p1": "t1"})
+    assert m.update({"p1": "t1"}) is m  # unchanged values stay clean
+
+    updated = m.update({"p1": "t3", "p2": "t2"})
+    assert updated.dirty
+    assert updated.project_to_tag == {"p1": "t3", "p2": "t2"}
+    assert m.get("p1") == "t1"  # original untouched
+
+    updated.save()
+    assert TagMap.load().project_to_tag == {"p1": "t3", "p2": "t2"}
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_load_sees_external_rewrite() -> None:
+    TagMap(project_to_tag={"p1": "t1"}).save()
+    assert TagMap.load().get("p1") == "t1"
+
+    tag_map_path().write_text(json.dumps({"p1": "t2", "p2": "t3"}), encoding="utf-8")
+    assert TagMap.load().get("p1") == "t2"
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_save_is_atomic_and_stable() -> None:
+    TagMap(project_to_tag={"p2": "t2", "p1": "t1"}).save()
+
+    path = tag_map_path()
+    assert path.read_text(encoding="utf-8") == '{\n  "p1": "t1",\n  "p2": "t2"\n}\n'
+    assert [p.name for p in path.parent.iterdir()] == [path.name]  # no temp file left
+
+
+@pytest.mark.usefixtures("home")
+def test_tag_map_malformed_file_loads_empty() -> None:
+    path = tag_map_path()
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert TagMap.load().project_to_tag == {}